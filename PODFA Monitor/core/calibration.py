@@ -10,19 +10,121 @@ Advanced calibration system
 """
 
 import time
+import os
+import math
 import logging
 import numpy as np
-from typing import List, Tuple, Optional, Dict, Any, Callable
+from typing import List, Tuple, Optional, Dict, Any, Callable, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import json
 from datetime import datetime
 from scipy.optimize import curve_fit
-from scipy import stats
 import threading
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 
+from .kernels import njit
+
+
+@njit(cache=True)
+def _fit_poly(x, y, degree):
+    """
+    Least-squares polynomial fit with fused R²/RMSE evaluation
+
+    Returns:
+        (coefficients in descending power order, r_squared, rmse)
+    """
+    n = x.shape[0]
+    m = degree + 1
+
+    # Vandermonde matrix (descending powers, same order as np.polyfit)
+    V = np.empty((n, m))
+    for i in range(n):
+        p = 1.0
+        for j in range(m - 1, -1, -1):
+            V[i, j] = p
+            p *= x[i]
+
+    # Scale columns to unit norm before solving (same conditioning step as
+    # numpy.polynomial.polynomial.polyfit), then undo the scaling
+    scale = np.empty(m)
+    for j in range(m):
+        norm = np.sqrt((V[:, j] * V[:, j]).sum())
+        scale[j] = norm if norm > 0.0 else 1.0
+    coeffs = np.linalg.lstsq(V / scale, y, rcond=-1.0)[0] / scale
+
+    # Single fused pass: predictions from the Vandermonde rows, residual sum
+    # and total sum of squares (Welford update, no separate mean pass)
+    ss_res = 0.0
+    ss_tot = 0.0
+    y_mean = 0.0
+    for i in range(n):
+        pred = 0.0
+        for j in range(m):
+            pred += V[i, j] * coeffs[j]
+        r = y[i] - pred
+        ss_res += r * r
+
+        d = y[i] - y_mean
+        y_mean += d / (i + 1)
+        ss_tot += d * (y[i] - y_mean)
+
+    # Constant targets: R² is undefined, report no explained variance
+    r_squared = 1.0 - ss_res / ss_tot if ss_tot > 0.0 else 0.0
+    return coeffs, r_squared, np.sqrt(ss_res / n)
+
+
+@njit(cache=True)
+def _fit_linear(x, y):
+    """
+    Closed-form linear least squares over centered data
+
+    Returns:
+        (slope, intercept, r_squared, rmse)
+    """
+    n = x.shape[0]
+    x_mean = 0.0
+    y_mean = 0.0
+    for i in range(n):
+        x_mean += x[i]
+        y_mean += y[i]
+    x_mean /= n
+    y_mean /= n
+
+    sxx = 0.0
+    sxy = 0.0
+    syy = 0.0
+    for i in range(n):
+        dx = x[i] - x_mean
+        dy = y[i] - y_mean
+        sxx += dx * dx
+        sxy += dx * dy
+        syy += dy * dy
+
+    slope = sxy / sxx
+    intercept = y_mean - slope * x_mean
+
+    # Explicit residuals (syy - slope*sxy cancels badly when R² ≈ 1)
+    ss_res = 0.0
+    for i in range(n):
+        r = (y[i] - y_mean) - slope * (x[i] - x_mean)
+        ss_res += r * r
+
+    # Constant targets: R² is undefined, report no explained variance
+    r_squared = 1.0 - ss_res / syy if syy > 0.0 else 0.0
+    return slope, intercept, r_squared, np.sqrt(ss_res / n)
+
+
+# Warm up JIT so the first calibration is not delayed by compilation
+_fit_poly(np.array([0.0, 1.0, 2.0]), np.array([0.0, 1.0, 2.0]), 1)
+_fit_linear(np.array([0.0, 1.0, 2.0]), np.array([0.0, 1.0, 2.0]))
+
 
 class CalibrationMethod(Enum):
     """Calibration method enumeration"""
@@ -45,19 +147,70 @@ class CalibrationState(Enum):
 class CalibrationPoint:
     """Calibration point"""
     reference_weight: float        # Reference weight (g)
-    sensor_readings: List[float]   # Sensor readings
+    sensor_readings: Union[List[float], np.ndarray]  # Sensor readings (ndarray once finalized)
     collection_time: float         # Collection time
     quality_score: float = 1.0     # Quality score
+    _avg: float = field(default=float('nan'), init=False, repr=False, compare=False)  # Cached mean
+    _std: float = field(default=float('nan'), init=False, repr=False, compare=False)  # Cached std
+    _buf: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)  # Collection buffer
+    _len: int = field(default=0, init=False, repr=False, compare=False)                      # Filled length of _buf
+
+    @classmethod
+    def from_stats(cls, reference_weight: float, sensor_readings: np.ndarray, collection_time: float,
+                   quality_score: float, average: float, std: float) -> 'CalibrationPoint':
+        """Create a finalized point with precomputed statistics"""
+        point = cls(reference_weight, sensor_readings, collection_time, quality_score)
+        point._avg = average
+        point._std = std
+        return point
+
+    def start_buffer(self, capacity: int):
+        """Preallocate the collection buffer"""
+        self._buf = np.empty(max(int(capacity), 16), dtype=np.float64)
+        self._len = 0
+
+    def append_reading(self, value: float):
+        """Append a reading to the collection buffer (grows by doubling)"""
+        if self._len == self._buf.shape[0]:
+            self._buf = np.concatenate((self._buf, np.empty_like(self._buf)))
+        self._buf[self._len] = value
+        self._len += 1
+
+    def finalize(self, start: int = 0):
+        """
+        Freeze readings as ndarray and cache statistics (call once collection ends)
+
+        Args:
+            start: Index of the first reading to keep (skips stabilization data)
+        """
+        if self._buf is not None:
+            self.sensor_readings = self._buf[start:self._len].copy()
+            self._buf = None
+        else:
+            self.sensor_readings = np.asarray(self.sensor_readings[start:], dtype=np.float64)
+        n = len(self.sensor_readings)
+        self._avg = float(self.sensor_readings.mean()) if n else 0.0
+        self._std = float(self.sensor_readings.std()) if n > 1 else 0.0
 
     @property
     def average_reading(self) -> float:
         """Average sensor reading"""
-        return np.mean(self.sensor_readings) if self.sensor_readings else 0.0
+        if not math.isnan(self._avg):
+            return self._avg
+        avg = float(np.mean(self.sensor_readings)) if len(self.sensor_readings) else 0.0
+        if isinstance(self.sensor_readings, np.ndarray):
+            self._avg = avg  # Frozen readings - safe to cache lazily
+        return avg
 
     @property
     def std_reading(self) -> float:
         """Standard deviation"""
-        return np.std(self.sensor_readings) if len(self.sensor_readings) > 1 else 0.0
+        if not math.isnan(self._std):
+            return self._std
+        std = float(np.std(self.sensor_readings)) if len(self.sensor_readings) > 1 else 0.0
+        if isinstance(self.sensor_readings, np.ndarray):
+            self._std = std  # Frozen readings - safe to cache lazily
+        return std
 
     @property
     def cv_percentage(self) -> float:
@@ -89,22 +242,47 @@ class CalibrationResult:
         else:
             return "Poor"
     
-    def apply(self, sensor_value: float) -> float:
-        """Convert sensor value to weight"""
-        if self.method == CalibrationMethod.LINEAR:
-            slope, intercept = self.coefficients
-            return slope * sensor_value + intercept
-        elif self.method == CalibrationMethod.POLYNOMIAL_2:
-            a, b, c = self.coefficients
-            return a * sensor_value**2 + b * sensor_value + c
+    def __post_init__(self):
+        """Precompute conversion helpers"""
+        self._coeff_array = np.asarray(self.coefficients, dtype=np.float64)
+
+        # Unpack coefficients once and bind a single conversion function
+        coeffs = tuple(float(c) for c in self.coefficients)
+        expected = {
+            CalibrationMethod.LINEAR: 2,
+            CalibrationMethod.POLYNOMIAL_2: 3,
+            CalibrationMethod.POLYNOMIAL_3: 4,
+        }.get(self.method)
+        if expected is not None and len(coeffs) != expected:
+            raise ValueError(
+                f"{self.method.value} calibration requires {expected} coefficients, got {len(coeffs)}"
+            )
+
+        if self.method == CalibrationMethod.POLYNOMIAL_2:
+            a, b, c = coeffs
+            self._apply = lambda v: (a * v + b) * v + c
         elif self.method == CalibrationMethod.POLYNOMIAL_3:
-            a, b, c, d = self.coefficients
-            return a * sensor_value**3 + b * sensor_value**2 + c * sensor_value + d
+            a, b, c, d = coeffs
+            self._apply = lambda v: ((a * v + b) * v + c) * v + d
+        elif len(coeffs) >= 2:
+            # Linear (also the default conversion for other methods)
+            slope, intercept = coeffs[0], coeffs[1]
+            self._apply = lambda v: slope * v + intercept
         else:
-            # Default linear conversion
-            if len(self.coefficients) >= 2:
-                return self.coefficients[0] * sensor_value + self.coefficients[1]
-            return sensor_value
+            self._apply = lambda v: v
+
+    def apply(self, sensor_value: float) -> float:
+        """Convert sensor value to weight"""
+        return self._apply(sensor_value)
+
+    def apply_array(self, sensor_values: np.ndarray) -> np.ndarray:
+        """Convert an array of sensor values to weights (vectorized)"""
+        values = np.asarray(sensor_values, dtype=np.float64)
+        if self.method in (CalibrationMethod.POLYNOMIAL_2, CalibrationMethod.POLYNOMIAL_3):
+            return np.polyval(self._coeff_array, values)
+        if len(self._coeff_array) >= 2:
+            return self._coeff_array[0] * values + self._coeff_array[1]
+        return values.copy()
 
 
 @dataclass
@@ -134,7 +312,8 @@ class CalibrationEngine(QObject):
     point_collected = pyqtSignal(CalibrationPoint)          # Point collection completed
     progress_updated = pyqtSignal(int, str)                 # Progress updated
     calibration_completed = pyqtSignal(CalibrationResult)   # Calibration completed
-    data_point_added = pyqtSignal(float)                    # Data point added
+    data_point_added = pyqtSignal(float)                    # Data point added (stabilization phase)
+    data_batch_added = pyqtSignal(np.ndarray)               # Collected readings batch (use for high-rate streams)
     error_occurred = pyqtSignal(str)                        # Error occurred
     
     def __init__(self, config: Optional[CollectionConfig] = None):
@@ -151,15 +330,50 @@ class CalibrationEngine(QObject):
         # Data storage
         self.calibration_points: List[CalibrationPoint] = []
         self.current_point: Optional[CalibrationPoint] = None
-        self.current_readings: List[float] = []
+        # (x, y) regression arrays built from calibration_points; reset whenever the list changes
+        self._xy_data: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+        # Regression results keyed by (method, point averages, reference weights)
+        self._fit_cache: Dict[tuple, Tuple[Tuple[float, ...], float, float]] = {}
+
+        # Index where actual collection starts in the current point buffer
+        # (readings before it are stabilization data)
+        self._actual_start_idx = 0
+
+        # Trailing 10-sample outlier window (running sums over the buffer tail,
+        # taken relative to _win_shift so large raw readings keep their precision)
+        self._win_size = 10
+        self._win_shift = 0.0
+        self._win_sum = 0.0
+        self._win_sumsq = 0.0
+        self._win_updates = 0
+        self._run_len = 0  # Trailing run of identical readings (constant window check)
+        self._outlier_thr_sq = 0.0  # Squared z-score limit, fixed per point collection
 
         # Collection management
         self.collection_start_time: Optional[float] = None
         self.target_weight: Optional[float] = None
-
-        # Timer
-        self.collection_timer = QTimer()
-        self.collection_timer.timeout.connect(self._check_collection_progress)
+        self.is_stabilizing = False
+        self.stabilization_start_time = 0.0
+
+        # Progress is driven by incoming readings; emit every N samples
+        self._progress_interval = 10
+        self._samples_seen = 0
+
+        # Coalesced emission: readings are queued and emitted once per tick
+        # so the UI updates at display rate rather than sensor rate
+        self._emit_interval_ms = 50
+        self._batch_buf = np.empty(64, dtype=np.float64)
+        self._batch_len = 0
+        self._pending_display: Optional[float] = None  # Latest stabilization reading
+        self.batch_flush_timer = QTimer()
+        self.batch_flush_timer.setSingleShot(True)
+        self.batch_flush_timer.timeout.connect(self._flush_batch)
+
+        # Watchdog timer (completes collection when data stops arriving)
+        self.watchdog_timer = QTimer()
+        self.watchdog_timer.setSingleShot(True)
+        self.watchdog_timer.timeout.connect(self._timeout_check)
         
         # Logging
         self.logger = logging.getLogger(__name__)
@@ -177,6 +391,8 @@ class CalibrationEngine(QObject):
 
         # Initialize
         self.calibration_points.clear()
+        self._xy_data = None
+        self._fit_cache.clear()
         self.current_step = 0
         self.total_steps = len(reference_weights)
         self.reference_weights = reference_weights
@@ -205,19 +421,25 @@ class CalibrationEngine(QObject):
 
         # Start new point
         self.target_weight = reference_weight
-        self.current_readings.clear()
+        self._reset_window()
+        # Increase outlier threshold in calibration mode (more lenient)
+        self._outlier_thr_sq = (self.config.outlier_threshold * 3.0) ** 2
         self.collection_start_time = time.time()
         self.stabilization_start_time = time.time()  # Stabilization start time
         self.is_stabilizing = True  # Stabilization phase flag
+        self._samples_seen = 0
 
         self.current_point = CalibrationPoint(
             reference_weight=reference_weight,
             sensor_readings=[],
             collection_time=time.time()
         )
+        self.current_point.start_buffer(max(self.config.min_samples * 2, 256))
 
-        # Start timer
-        self.collection_timer.start(100)  # Check every 100ms
+        # Start watchdog (stabilization + max 2x collection time)
+        self.watchdog_timer.start(
+            int((self.config.stabilization_time + self.config.collection_duration * 2) * 1000)
+        )
 
         self.logger.info(f"Point collection started: {reference_weight}g (waiting for stabilization...)")
         self.progress_updated.emit(0, f"Stabilizing... {reference_weight}g")
@@ -235,19 +457,21 @@ class CalibrationEngine(QObject):
             return
 
         # During stabilization phase, only buffer data, don't actually collect
-        if hasattr(self, 'is_stabilizing') and self.is_stabilizing:
+        if self.is_stabilizing:
             # Perform outlier check even during stabilization, but relaxed
-            if len(self.current_readings) >= 20:  # Only when sufficient data exists
+            if self.current_point._len >= 20:  # Only when sufficient data exists
                 if self._is_outlier(sensor_value):
                     self.logger.debug(f"Outlier removed during stabilization: {sensor_value}")
                     return
 
-            # Add stabilization data (keep max 50)
-            self.current_readings.append(sensor_value)
-            if len(self.current_readings) > 50:
-                self.current_readings.pop(0)
+            # Add stabilization data
+            self._push_reading(sensor_value)
 
-            self.data_point_added.emit(sensor_value)
+            # Only the latest stabilization reading is shown per tick
+            self._pending_display = sensor_value
+            if not self.batch_flush_timer.isActive():
+                self.batch_flush_timer.start(self._emit_interval_ms)
+            self._maybe_advance(time.time())
             return
 
         # Outlier check during actual collection phase (relaxed)
@@ -256,26 +480,38 @@ class CalibrationEngine(QObject):
             return
 
         # Add data
-        self.current_readings.append(sensor_value)
-        self.current_point.sensor_readings.append(sensor_value)
+        self._push_reading(sensor_value)
 
-        # Emit signal
-        self.data_point_added.emit(sensor_value)
+        # Queue for coalesced emission
+        if self._batch_len == self._batch_buf.shape[0]:
+            self._batch_buf = np.concatenate((self._batch_buf, np.empty_like(self._batch_buf)))
+        self._batch_buf[self._batch_len] = sensor_value
+        self._batch_len += 1
+        if not self.batch_flush_timer.isActive():
+            self.batch_flush_timer.start(self._emit_interval_ms)
+
+        self._maybe_advance(time.time())
     
     def complete_current_point(self) -> bool:
         """Complete current point collection"""
-        if not self.current_point or not self.current_readings:
+        if not self.current_point or self.current_point._len == 0:
             self.logger.error("No data to collect")
             return False
 
+        # Drop stabilization data, freeze readings and cache statistics
+        start = self.current_point._len if self.is_stabilizing else self._actual_start_idx
+        self.current_point.finalize(start)
+
         # Quality assessment
         self.current_point.quality_score = self._evaluate_point_quality(
             self.current_point
         )
 
         # Collection completed
-        self.collection_timer.stop()
+        self.watchdog_timer.stop()
+        self._flush_batch()
         self.calibration_points.append(self.current_point)
+        self._xy_data = None
 
         # Restore state to IDLE (wizard controls next step)
         self._set_state(CalibrationState.IDLE)
@@ -301,12 +537,15 @@ class CalibrationEngine(QObject):
 
         return True
     
-    def calculate_calibration(self, method: CalibrationMethod = CalibrationMethod.LINEAR) -> Optional[CalibrationResult]:
+    def calculate_calibration(self, method: CalibrationMethod = CalibrationMethod.LINEAR,
+                              points_snapshot: Optional[List[CalibrationPoint]] = None) -> Optional[CalibrationResult]:
         """
         Calculate calibration
 
         Args:
             method: Calibration method
+            points_snapshot: Points to attach to the result as-is (shared between
+                results instead of copying calibration_points each call)
 
         Returns:
             Calibration result
@@ -319,18 +558,23 @@ class CalibrationEngine(QObject):
         
         try:
             # Prepare data
-            x_data = np.array([point.average_reading for point in self.calibration_points])
-            y_data = np.array([point.reference_weight for point in self.calibration_points])
-
-            # Regression analysis
-            if method == CalibrationMethod.LINEAR:
-                coeffs, r_squared, rmse = self._linear_regression(x_data, y_data)
-            elif method == CalibrationMethod.POLYNOMIAL_2:
-                coeffs, r_squared, rmse = self._polynomial_regression(x_data, y_data, 2)
-            elif method == CalibrationMethod.POLYNOMIAL_3:
-                coeffs, r_squared, rmse = self._polynomial_regression(x_data, y_data, 3)
+            x_data, y_data = self._get_xy_data()
+
+            # Regression analysis (memoized on method and point data)
+            cache_key = (method, tuple(np.round(x_data, 9)), tuple(y_data))
+            cached = self._fit_cache.get(cache_key)
+            if cached is not None:
+                coeffs, r_squared, rmse = cached
             else:
-                coeffs, r_squared, rmse = self._linear_regression(x_data, y_data)
+                if method == CalibrationMethod.LINEAR:
+                    coeffs, r_squared, rmse = self._linear_regression(x_data, y_data)
+                elif method == CalibrationMethod.POLYNOMIAL_2:
+                    coeffs, r_squared, rmse = self._polynomial_regression(x_data, y_data, 2)
+                elif method == CalibrationMethod.POLYNOMIAL_3:
+                    coeffs, r_squared, rmse = self._polynomial_regression(x_data, y_data, 3)
+                else:
+                    coeffs, r_squared, rmse = self._linear_regression(x_data, y_data)
+                self._fit_cache[cache_key] = (coeffs, r_squared, rmse)
 
             # Create result
             result = CalibrationResult(
@@ -338,7 +582,7 @@ class CalibrationEngine(QObject):
                 coefficients=coeffs,
                 r_squared=r_squared,
                 rmse=rmse,
-                points=self.calibration_points.copy(),
+                points=points_snapshot if points_snapshot is not None else self.calibration_points.copy(),
                 created_time=time.time()
             )
 
@@ -365,11 +609,22 @@ class CalibrationEngine(QObject):
         """
         Save calibration result
 
+        Metadata is written as JSON to filename; the bulk sensor readings
+        go to a compressed .npz file next to it.
+
         Args:
             result: Calibration result
             filename: Filename to save
         """
         try:
+            readings_file = os.path.splitext(filename)[0] + '.npz'
+            arrays = [np.asarray(point.sensor_readings, dtype=np.float64) for point in result.points]
+            np.savez_compressed(
+                readings_file,
+                readings=np.concatenate(arrays) if arrays else np.empty(0, dtype=np.float64),
+                offsets=np.cumsum([len(a) for a in arrays], dtype=np.int64)
+            )
+
             data = {
                 'method': result.method.value,
                 'coefficients': result.coefficients,
@@ -377,10 +632,10 @@ class CalibrationEngine(QObject):
                 'rmse': result.rmse,
                 'created_time': result.created_time,
                 'validation_passed': result.validation_passed,
+                'readings_file': os.path.basename(readings_file),
                 'points': [
                     {
                         'reference_weight': point.reference_weight,
-                        'sensor_readings': point.sensor_readings,
                         'collection_time': point.collection_time,
                         'quality_score': point.quality_score
                     }
@@ -388,8 +643,12 @@ class CalibrationEngine(QObject):
                 ]
             }
 
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
 
             self.logger.info(f"Calibration saved: {filename}")
 
@@ -408,19 +667,47 @@ class CalibrationEngine(QObject):
             Calibration result
         """
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            # Restore points
-            points = []
-            for point_data in data['points']:
-                point = CalibrationPoint(
-                    reference_weight=point_data['reference_weight'],
-                    sensor_readings=point_data['sensor_readings'],
-                    collection_time=point_data['collection_time'],
-                    quality_score=point_data.get('quality_score', 1.0)
+            if orjson is not None:
+                with open(filename, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(filename, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+
+            # Restore bulk readings (older files keep them inline in JSON)
+            if 'readings_file' in data:
+                readings_file = os.path.join(os.path.dirname(filename), data['readings_file'])
+                with np.load(readings_file) as npz:
+                    readings = npz['readings'].astype(np.float64, copy=False)
+                    ends = npz['offsets'].astype(np.int64, copy=False)
+            else:
+                arrays = [np.asarray(p['sensor_readings'], dtype=np.float64) for p in data['points']]
+                readings = np.concatenate(arrays) if arrays else np.empty(0, dtype=np.float64)
+                ends = np.cumsum([len(a) for a in arrays], dtype=np.int64)
+
+            # Per-point statistics in one vectorized pass over all readings
+            counts = np.diff(ends, prepend=0)
+            owner = np.repeat(np.arange(len(counts)), counts)
+            safe_counts = np.maximum(counts, 1)
+            means = np.bincount(owner, weights=readings, minlength=len(counts)) / safe_counts
+            deviations = readings - means[owner]
+            stds = np.sqrt(np.bincount(owner, weights=deviations * deviations,
+                                       minlength=len(counts)) / safe_counts)
+            stds[counts < 2] = 0.0
+
+            # Restore points (readings are views into the shared array)
+            points = [
+                CalibrationPoint.from_stats(
+                    reference_weight=float(point_data['reference_weight']),
+                    sensor_readings=readings[end - count:end],
+                    collection_time=float(point_data['collection_time']),
+                    quality_score=float(point_data.get('quality_score', 1.0)),
+                    average=mean,
+                    std=std
                 )
-                points.append(point)
+                for point_data, count, end, mean, std in zip(
+                    data['points'], counts.tolist(), ends.tolist(), means.tolist(), stds.tolist())
+            ]
 
             # Restore result
             result = CalibrationResult(
@@ -443,10 +730,12 @@ class CalibrationEngine(QObject):
     
     def cancel_calibration(self):
         """Cancel calibration"""
-        self.collection_timer.stop()
+        self.watchdog_timer.stop()
         self.calibration_points.clear()
+        self._xy_data = None
+        self._fit_cache.clear()
         self.current_point = None
-        self.current_readings.clear()
+        self._reset_window()
         self.current_step = 0
 
         self._set_state(CalibrationState.IDLE)
@@ -458,121 +747,178 @@ class CalibrationEngine(QObject):
             next_weight = self.reference_weights[self.current_step]
             self.start_point_collection(next_weight)
 
-    def _check_collection_progress(self):
-        """Check collection progress"""
+    def _maybe_advance(self, current_time: float):
+        """
+        Advance collection progress on each accepted reading
+
+        Args:
+            current_time: Arrival time of the reading
+        """
         if not self.current_point or not self.collection_start_time:
             return
 
-        current_time = time.time()
+        self._samples_seen += 1
+        report = self._samples_seen % self._progress_interval == 0
 
         # Handle stabilization phase
-        if hasattr(self, 'is_stabilizing') and self.is_stabilizing:
+        if self.is_stabilizing:
             stabilization_elapsed = current_time - self.stabilization_start_time
-            stabilization_progress = min(int((stabilization_elapsed / self.config.stabilization_time) * 100), 100)
 
-            sample_count = len(self.current_readings)
-            status = f"Stabilizing... {self.target_weight}g ({sample_count} samples, {stabilization_elapsed:.1f}s)"
-            self.progress_updated.emit(stabilization_progress, status)
+            if report:
+                stabilization_progress = min(int((stabilization_elapsed / self.config.stabilization_time) * 100), 100)
+                sample_count = self.current_point._len
+                status = f"Stabilizing... {self.target_weight}g ({sample_count} samples, {stabilization_elapsed:.1f}s)"
+                self.progress_updated.emit(stabilization_progress, status)
 
             # Check stabilization completion
             if stabilization_elapsed >= self.config.stabilization_time:
                 self.is_stabilizing = False
                 self.collection_start_time = current_time  # Reset actual collection start time
-                self.current_point.sensor_readings.clear()  # Clear stabilization data
+                self._actual_start_idx = self.current_point._len  # Skip stabilization data
+                self._samples_seen = 0
+                self.watchdog_timer.start(int(self.config.collection_duration * 2 * 1000))
                 self.logger.info(f"Stabilization completed, starting actual collection: {self.target_weight}g")
                 self.progress_updated.emit(0, f"Collecting... {self.target_weight}g")
             return
 
         # Actual collection phase
         elapsed = current_time - self.collection_start_time
-        progress = min(int((elapsed / self.config.collection_duration) * 100), 100)
-
-        # Update progress
-        sample_count = len(self.current_point.sensor_readings)  # Only actual collected data
-        total_samples = len(self.current_readings)  # All including stabilization
+        sample_count = self.current_point._len - self._actual_start_idx  # Only actual collected data
 
-        status = f"Collecting... {self.target_weight}g ({sample_count}/{self.config.min_samples} samples)"
-        self.progress_updated.emit(progress, status)
+        if report:
+            progress = min(int((elapsed / self.config.collection_duration) * 100), 100)
+            status = f"Collecting... {self.target_weight}g ({sample_count}/{self.config.min_samples} samples)"
+            self.progress_updated.emit(progress, status)
 
         # Check collection completion
         if (elapsed >= self.config.collection_duration and
             sample_count >= self.config.min_samples):
-
-            # Quality check
-            if sample_count > 0:  # Complete only if data exists
-                self.complete_current_point()
-            else:
-                # Wait longer if no data
-                self.logger.warning(f"Insufficient collected data: {sample_count}")
+            self.complete_current_point()
         elif elapsed >= self.config.collection_duration * 2:  # Wait max 2x
             # Timeout, force completion
-            self.logger.warning(f"Timeout, force completion: {sample_count} samples")
             if sample_count > 10:  # Complete if minimum data exists
+                self.logger.warning(f"Timeout, force completion: {sample_count} samples")
                 self.complete_current_point()
-    
+
+    def _timeout_check(self):
+        """Watchdog timeout - handle collection when no more data arrives"""
+        if self.state != CalibrationState.COLLECTING or not self.current_point:
+            return
+
+        sample_count = 0 if self.is_stabilizing else self.current_point._len - self._actual_start_idx
+        if sample_count > 10:  # Complete if minimum data exists
+            self.logger.warning(f"Timeout, force completion: {sample_count} samples")
+            self.complete_current_point()
+        else:
+            self.logger.warning(f"Insufficient collected data: {sample_count}")
+
+    def _push_reading(self, value: float):
+        """Append reading to the current point buffer"""
+        point = self.current_point
+        n = point._len
+        w = self._win_size
+
+        # Update outlier window sums in O(1) (shifted by the first reading)
+        if n == 0:
+            self._win_shift = value
+        if n >= w:
+            old = point._buf[n - w] - self._win_shift
+            self._win_sum -= old
+            self._win_sumsq -= old * old
+        self._run_len = self._run_len + 1 if n and point._buf[n - 1] == value else 1
+        point.append_reading(value)
+        d = value - self._win_shift
+        self._win_sum += d
+        self._win_sumsq += d * d
+
+        # Recompute exactly every window length to prevent rounding drift,
+        # re-centring the shift on the current window mean
+        self._win_updates += 1
+        if self._win_updates >= w and n + 1 >= w:
+            window = point._buf[n + 1 - w:n + 1]
+            self._win_shift = float(window.mean())
+            centred = window - self._win_shift
+            self._win_sum = float(centred.sum())
+            self._win_sumsq = float(centred @ centred)
+            self._win_updates = 0
+
+    def _flush_batch(self):
+        """Emit readings queued since the last tick"""
+        self.batch_flush_timer.stop()
+        if self._pending_display is not None:
+            self.data_point_added.emit(self._pending_display)
+            self._pending_display = None
+        if self._batch_len:
+            self.data_batch_added.emit(self._batch_buf[:self._batch_len].copy())
+            self._batch_len = 0
+
+    def _reset_window(self):
+        """Reset the collection buffer state"""
+        self.batch_flush_timer.stop()
+        self._batch_len = 0
+        self._pending_display = None
+        self._actual_start_idx = 0
+        self._win_shift = 0.0
+        self._win_sum = 0.0
+        self._win_sumsq = 0.0
+        self._win_updates = 0
+        self._run_len = 0
+
     def _is_outlier(self, value: float) -> bool:
         """Outlier detection (relaxed in calibration mode)"""
-        if len(self.current_readings) < 10:
+        n = self._win_size
+        if self.current_point._len < n:
             return False
 
-        # Increase outlier threshold in calibration mode (more lenient)
-        outlier_threshold = self.config.outlier_threshold * 3.0
+        # Constant window (max == min): no spread to judge against
+        if self._run_len >= n:
+            return False
 
-        recent = self.current_readings[-10:]
-        mean_val = np.mean(recent)
-        std_val = np.std(recent)
+        mean_shifted = self._win_sum / n
+        var_val = self._win_sumsq / n - mean_shifted * mean_shifted
 
-        if std_val == 0:
+        if var_val <= 0:
             return False
 
-        z_score = abs((value - mean_val) / std_val)
-
-        # Allow large variations during calibration
-        return z_score > outlier_threshold
+        # Allow large variations during calibration (squared z-score, no sqrt)
+        diff = (value - self._win_shift) - mean_shifted
+        return diff * diff > self._outlier_thr_sq * var_val
     
-    def _evaluate_point_quality(self, point: CalibrationPoint) -> float:
-        """Evaluate point quality"""
-        quality = 1.0
-
-        # Coefficient of variation criteria
-        cv = point.cv_percentage
-        if cv > self.config.max_cv_percentage:
-            quality *= 0.5
+    def evaluate_points_quality(self, cv: np.ndarray, sample_counts: np.ndarray) -> np.ndarray:
+        """
+        Evaluate quality of multiple points at once
 
-        # Sample count criteria
-        if len(point.sensor_readings) < self.config.min_samples:
-            quality *= 0.7
+        Args:
+            cv: Coefficient of variation (%) per point
+            sample_counts: Number of readings per point
 
-        return max(0.0, min(1.0, quality))
-    
-    def _linear_regression(self, x_data: np.ndarray, y_data: np.ndarray) -> Tuple[Tuple[float, float], float, float]:
-        """Linear regression"""
-        slope, intercept, r_value, p_value, std_err = stats.linregress(x_data, y_data)
+        Returns:
+            Quality score per point (0.0 ~ 1.0)
+        """
+        cv = np.asarray(cv, dtype=np.float64)
+        sample_counts = np.asarray(sample_counts)
 
-        # Calculate predictions
-        y_pred = slope * x_data + intercept
+        # Coefficient of variation and sample count criteria
+        quality = (np.where(cv > self.config.max_cv_percentage, 0.5, 1.0) *
+                   np.where(sample_counts < self.config.min_samples, 0.7, 1.0))
 
-        # Calculate RMSE
-        rmse = np.sqrt(np.mean((y_data - y_pred) ** 2))
+        return np.clip(quality, 0.0, 1.0)
 
-        return (slope, intercept), r_value ** 2, rmse
+    def _evaluate_point_quality(self, point: CalibrationPoint) -> float:
+        """Evaluate point quality"""
+        return float(self.evaluate_points_quality(
+            [point.cv_percentage], [len(point.sensor_readings)]
+        )[0])
+    
+    def _linear_regression(self, x_data: np.ndarray, y_data: np.ndarray) -> Tuple[Tuple[float, float], float, float]:
+        """Linear regression (closed-form, two-pass)"""
+        slope, intercept, r_squared, rmse = _fit_linear(x_data, y_data)
+        return (float(slope), float(intercept)), float(r_squared), float(rmse)
 
     def _polynomial_regression(self, x_data: np.ndarray, y_data: np.ndarray, degree: int) -> Tuple[Tuple[float, ...], float, float]:
         """Polynomial regression"""
-        coeffs = np.polyfit(x_data, y_data, degree)
-
-        # Calculate predictions
-        y_pred = np.polyval(coeffs, x_data)
-
-        # Calculate R²
-        ss_res = np.sum((y_data - y_pred) ** 2)
-        ss_tot = np.sum((y_data - np.mean(y_data)) ** 2)
-        r_squared = 1 - (ss_res / ss_tot)
-
-        # Calculate RMSE
-        rmse = np.sqrt(np.mean((y_data - y_pred) ** 2))
-
-        return tuple(coeffs), r_squared, rmse
+        coeffs, r_squared, rmse = _fit_poly(x_data, y_data, degree)
+        return tuple(float(c) for c in coeffs), float(r_squared), float(rmse)
     
     def _validate_calibration(self, result: CalibrationResult) -> bool:
         """Validate calibration"""
@@ -599,21 +945,97 @@ class CalibrationEngine(QObject):
 
         return True
 
-    def _process_calibration(self):
-        """Process calibration"""
-        # Automatically select optimal method
+    def _fit_all_degrees(self, x_data: np.ndarray, y_data: np.ndarray, max_degree: int = 3) -> List[Tuple[Tuple[float, ...], float, float]]:
+        """
+        Fit degrees 1..max_degree from a single QR factorization
+
+        The increasing-power Vandermonde columns are nested, so each lower
+        degree fit is the leading block of the same triangular system.
+
+        Returns:
+            List of (coefficients, r_squared, rmse) for degree 1..max_degree
+        """
+        n = len(x_data)
+        V = np.vander(x_data, max_degree + 1, increasing=True)
+
+        # Column scaling for numerical conditioning (does not break nesting)
+        scale = np.sqrt((V * V).sum(axis=0))
+        scale[scale == 0] = 1.0
+        Q, R = np.linalg.qr(V / scale)
+        qty = Q.T @ y_data
+
+        ss_tot = float(((y_data - y_data.mean()) ** 2).sum())
+        fits = []
+        for degree in range(1, max_degree + 1):
+            k = degree + 1
+            if k > n:
+                # Underdetermined - fall back to minimum-norm least squares
+                coeffs, r_squared, rmse = _fit_poly(x_data, y_data, degree)
+                fits.append((tuple(float(c) for c in coeffs), float(r_squared), float(rmse)))
+                continue
+
+            c = np.linalg.solve(R[:k, :k], qty[:k]) / scale[:k]
+            residual = y_data - V[:, :k] @ c
+            ss_res = float((residual * residual).sum())
+            # Constant targets: same convention as the fit kernels
+            r_squared = 1.0 - ss_res / ss_tot if ss_tot > 0.0 else 0.0
+            fits.append((
+                tuple(float(v) for v in c[::-1]),  # Descending power order
+                r_squared,
+                float(np.sqrt(ss_res / n))
+            ))
+
+        return fits
+
+    def _get_xy_data(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Regression input arrays (sensor averages, reference weights), built once per point set"""
+        if self._xy_data is None:
+            n = len(self.calibration_points)
+            x_data = np.empty(n, dtype=np.float64)
+            y_data = np.empty(n, dtype=np.float64)
+            for i, point in enumerate(self.calibration_points):
+                x_data[i] = point.average_reading
+                y_data[i] = point.reference_weight
+            # Shared between fits (and cache keys) - keep them immutable
+            x_data.setflags(write=False)
+            y_data.setflags(write=False)
+            self._xy_data = (x_data, y_data)
+        return self._xy_data
+
+    def _select_best_fit(self, x_data: np.ndarray, y_data: np.ndarray,
+                         points: List[CalibrationPoint]) -> CalibrationResult:
+        """
+        Fit all candidate methods and select the best one
+
+        All candidate results share the same points snapshot.
+        """
         methods = [
             CalibrationMethod.LINEAR,
             CalibrationMethod.POLYNOMIAL_2,
             CalibrationMethod.POLYNOMIAL_3
         ]
 
+        fits = self._fit_all_degrees(x_data, y_data)
+
+        created_time = time.time()
+        results = []
+        for method, (coeffs, r_squared, rmse) in zip(methods, fits):
+            result = CalibrationResult(
+                method=method,
+                coefficients=coeffs,
+                r_squared=r_squared,
+                rmse=rmse,
+                points=points,
+                created_time=created_time
+            )
+            result.validation_passed = self._validate_calibration(result)
+            results.append(result)
+
         best_result = None
         best_score = -1
 
-        for method in methods:
-            result = self.calculate_calibration(method)
-            if result and result.validation_passed:
+        for result in results:
+            if result.validation_passed:
                 # Calculate score (R² priority, RMSE consideration)
                 score = result.r_squared - (result.rmse * 0.1)
                 if score > best_score:
@@ -624,7 +1046,31 @@ class CalibrationEngine(QObject):
             self.logger.info(f"Optimal method selected: {best_result.method.value}")
         else:
             # Provide linear regression result even if validation fails
-            best_result = self.calculate_calibration(CalibrationMethod.LINEAR)
+            best_result = results[0]
+
+        return best_result
+
+    def _process_calibration(self) -> Optional[CalibrationResult]:
+        """Process calibration (automatic method selection)"""
+        if len(self.calibration_points) < 2:
+            self.logger.error("Minimum 2 points required")
+            return None
+
+        self._set_state(CalibrationState.PROCESSING)
+
+        try:
+            x_data, y_data = self._get_xy_data()
+            best_result = self._select_best_fit(x_data, y_data, self.calibration_points.copy())
+
+            self._set_state(CalibrationState.COMPLETED)
+            self.calibration_completed.emit(best_result)
+            return best_result
+
+        except Exception as e:
+            self.logger.error(f"Calibration calculation error: {e}")
+            self.error_occurred.emit(f"Calculation error: {str(e)}")
+            self._set_state(CalibrationState.ERROR)
+            return None
 
     def _set_state(self, new_state: CalibrationState):
         """Change state"""
@@ -636,10 +1082,12 @@ class CalibrationEngine(QObject):
 
     def cleanup(self):
         """Clean up resources"""
-        self.collection_timer.stop()
+        self.watchdog_timer.stop()
         self.calibration_points.clear()
+        self._xy_data = None
+        self._fit_cache.clear()
         self.current_point = None
-        self.current_readings.clear()
+        self._reset_window()
         self._set_state(CalibrationState.IDLE)
 
 
@@ -10,7 +10,11 @@ PBS 2.0 Data Processing Engine
 """
 
 import time
+import math
+import bisect
+import functools
 import logging
+import warnings
 import numpy as np
 import polars as pl
 from collections import deque
@@ -18,15 +22,21 @@ from typing import Optional, List, Tuple, Dict, Any, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 import threading
-from queue import Queue, Empty
 
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 
+from .kernels import njit
+
 try:
     from scipy import signal
 except ImportError:
     signal = None
 
+try:
+    from sortedcontainers import SortedList
+except ImportError:
+    SortedList = None
+
 # 캘리브레이션 임포트 (옵션)
 try:
     from core.calibration import CalibrationResult
@@ -34,6 +44,22 @@ except ImportError:
     CalibrationResult = None
 
 
+@njit(cache=True)
+def _fused_moments(values):
+    """합계와 제곱합을 한 번의 순회로 계산 (윈도우 누적 합 재동기화용)"""
+    total = 0.0
+    total_sq = 0.0
+    for i in range(values.shape[0]):
+        x = values[i]
+        total += x
+        total_sq += x * x
+    return total, total_sq
+
+
+# JIT 워밍업 (첫 재동기화 시 컴파일 지연 방지)
+_fused_moments(np.zeros(1))
+
+
 class FilterType(Enum):
     """필터 타입 열거형"""
     NONE = "none"
@@ -63,7 +89,65 @@ class DataPoint:
             return self.raw_value
 
 
-@dataclass
+class DataPointView:
+    """
+    필드별 배열의 한 행을 DataPoint처럼 읽는 읽기 전용 뷰
+    
+    일괄 처리 결과를 DataPoint 객체로 복사하지 않고, 속성 접근 시에만 값을 꺼냅니다.
+    """
+    
+    __slots__ = ('_columns', '_index')
+    
+    def __init__(self, columns: Tuple[np.ndarray, ...], index: int):
+        self._columns = columns  # (timestamp, raw, filtered, calibrated, quality) 순서
+        self._index = index
+    
+    @property
+    def timestamp(self) -> float:
+        return float(self._columns[0][self._index])
+    
+    @property
+    def raw_value(self) -> float:
+        return float(self._columns[1][self._index])
+    
+    @property
+    def filtered_value(self) -> Optional[float]:
+        value = float(self._columns[2][self._index])
+        return None if value != value else value  # NaN -> None
+    
+    @property
+    def calibrated_value(self) -> Optional[float]:
+        value = float(self._columns[3][self._index])
+        return None if value != value else value  # NaN -> None
+    
+    @property
+    def quality_score(self) -> float:
+        return float(self._columns[4][self._index])
+    
+    @property
+    def value(self) -> float:
+        """최종 값 반환 (캘리브레이션 > 필터링 > 원시값 순서)"""
+        for column in (self._columns[3], self._columns[2], self._columns[1]):
+            value = float(column[self._index])
+            if value == value:
+                return value
+        return float(self._columns[1][self._index])
+    
+    def to_point(self) -> DataPoint:
+        """독립된 DataPoint로 변환"""
+        return DataPoint(
+            timestamp=self.timestamp,
+            raw_value=self.raw_value,
+            filtered_value=self.filtered_value,
+            calibrated_value=self.calibrated_value,
+            quality_score=self.quality_score
+        )
+    
+    def __repr__(self) -> str:
+        return f"DataPointView({self.to_point()!r})"
+
+
+@dataclass(slots=True)
 class StatisticsSnapshot:
     """통계 스냅샷"""
     count: int = 0
@@ -100,44 +184,274 @@ class ProcessingConfig:
 
 
 class CircularBuffer:
-    """메모리 효율적인 순환 버퍼"""
+    """메모리 효율적인 순환 버퍼 (필드별 NumPy 배열, SoA 구조)"""
+    
+    FIELDS = ('timestamp', 'raw_value', 'filtered_value', 'calibrated_value', 'quality_score')
     
     def __init__(self, max_size: int):
         self.max_size = max_size
-        self._buffer = deque(maxlen=max_size)
         self._lock = threading.Lock()
+        
+        # 필드별 사전 할당 배열 (None 값은 NaN으로 저장)
+        self._timestamp = np.empty(max_size, dtype=np.float64)
+        self._raw = np.empty(max_size, dtype=np.float64)
+        self._filtered = np.empty(max_size, dtype=np.float64)
+        self._calibrated = np.empty(max_size, dtype=np.float64)
+        self._quality = np.empty(max_size, dtype=np.float64)
+        self._arrays = (self._timestamp, self._raw, self._filtered, self._calibrated, self._quality)
+        
+        self._head = 0   # 다음 기록 위치
+        self._count = 0  # 저장된 항목 수
     
     def append(self, item: DataPoint):
         """항목 추가"""
+        self.append_values(
+            item.timestamp, item.raw_value, item.filtered_value,
+            item.calibrated_value, item.quality_score
+        )
+    
+    def append_values(self, timestamp: float, raw_value: float,
+                      filtered_value: Optional[float] = None,
+                      calibrated_value: Optional[float] = None,
+                      quality_score: float = 1.0):
+        """필드 값 직접 추가 (DataPoint 생성 없이)"""
+        with self._lock:
+            i = self._head
+            self._timestamp[i] = timestamp
+            self._raw[i] = raw_value
+            self._filtered[i] = np.nan if filtered_value is None else filtered_value
+            self._calibrated[i] = np.nan if calibrated_value is None else calibrated_value
+            self._quality[i] = quality_score
+            self._head = (i + 1) % self.max_size
+            if self._count < self.max_size:
+                self._count += 1
+    
+    def extend_values(self, timestamps: np.ndarray, raw_values: np.ndarray,
+                      filtered_values: np.ndarray, calibrated_values: np.ndarray,
+                      quality_scores: np.ndarray):
+        """필드별 배열 일괄 추가"""
+        columns = (timestamps, raw_values, filtered_values, calibrated_values, quality_scores)
+        n = len(raw_values)
+        if n > self.max_size:
+            # 버퍼보다 많으면 최신 데이터만 유지
+            columns = tuple(np.asarray(c)[-self.max_size:] for c in columns)
+            n = self.max_size
+        
         with self._lock:
-            self._buffer.append(item)
+            idx = (self._head + np.arange(n)) % self.max_size
+            for array, column in zip(self._arrays, columns):
+                array[idx] = column
+            self._head = (self._head + n) % self.max_size
+            self._count = min(self._count + n, self.max_size)
+    
+    def _latest(self, array: np.ndarray, count: int) -> np.ndarray:
+        """배열의 최신 N개 값을 시간순으로 반환 (잠금 보유 상태에서 호출)"""
+        count = min(count, self._count)
+        start = self._head - count
+        if start >= 0:
+            return array[start:self._head].copy()
+        return np.concatenate((array[start:], array[:self._head]))
+    
+    def get_latest_arrays(self, count: int) -> Dict[str, np.ndarray]:
+        """최신 N개 항목을 필드별 배열로 반환"""
+        with self._lock:
+            return {name: self._latest(array, count) for name, array in zip(self.FIELDS, self._arrays)}
     
     def get_latest(self, count: int) -> List[DataPoint]:
         """최신 N개 항목 반환"""
+        return self.to_points(self.get_latest_arrays(count))
+    
+    def get_latest_values(self, count: int) -> np.ndarray:
+        """최신 N개 필터링 값 반환 (필터링 값이 없으면 원시값)"""
+        with self._lock:
+            filtered = self._latest(self._filtered, count)
+            raw = self._latest(self._raw, count)
+        return np.where(np.isnan(filtered) | (filtered == 0.0), raw, filtered)
+    
+    def get_latest_final_values(self, count: int) -> np.ndarray:
+        """최신 N개 최종 값 반환 (캘리브레이션 > 필터링 > 원시값 순서, DataPoint.value와 동일)"""
         with self._lock:
-            if count >= len(self._buffer):
-                return list(self._buffer)
-            return list(self._buffer)[-count:]
+            calibrated = self._latest(self._calibrated, count)
+            filtered = self._latest(self._filtered, count)
+            raw = self._latest(self._raw, count)
+        return np.where(~np.isnan(calibrated), calibrated,
+                        np.where(~np.isnan(filtered), filtered, raw))
+    
+    def get_latest_raw(self, count: int) -> List[float]:
+        """최신 N개 원시값을 float 리스트로 반환 (소량 조회용, 배열 복사 없음)"""
+        with self._lock:
+            count = min(count, self._count)
+            base = self._head - count
+            return [self._raw.item((base + k) % self.max_size) for k in range(count)]
     
     def get_range(self, start_idx: int, end_idx: int) -> List[DataPoint]:
         """범위 데이터 반환"""
         with self._lock:
-            buffer_list = list(self._buffer)
-            return buffer_list[start_idx:end_idx]
+            logical = np.arange(self._count)[start_idx:end_idx]
+            physical = (self._head - self._count + logical) % self.max_size
+            arrays = {name: array[physical] for name, array in zip(self.FIELDS, self._arrays)}
+        return self.to_points(arrays)
     
     def get_all(self) -> List[DataPoint]:
         """모든 데이터 반환"""
-        with self._lock:
-            return list(self._buffer)
+        return self.get_latest(self.max_size)
     
     def clear(self):
         """버퍼 초기화"""
         with self._lock:
-            self._buffer.clear()
+            self._head = 0
+            self._count = 0
+    
+    @staticmethod
+    def to_points(arrays: Dict[str, np.ndarray]) -> List[DataPoint]:
+        """필드별 배열을 DataPoint 목록으로 변환 (요청 시에만 생성)"""
+        points = []
+        for ts, raw, filtered, calibrated, quality in zip(
+                *(arrays[name].tolist() for name in CircularBuffer.FIELDS)):
+            points.append(DataPoint(
+                timestamp=ts,
+                raw_value=raw,
+                filtered_value=None if filtered != filtered else filtered,  # NaN -> None
+                calibrated_value=None if calibrated != calibrated else calibrated,
+                quality_score=quality
+            ))
+        return points
+    
+    @staticmethod
+    def to_views(arrays: Dict[str, np.ndarray]) -> List[DataPointView]:
+        """필드별 배열을 DataPointView 목록으로 변환 (배열을 공유하며 값은 접근 시 변환)"""
+        columns = tuple(arrays[name] for name in CircularBuffer.FIELDS)
+        return [DataPointView(columns, index) for index in range(len(columns[0]))]
+    
+    def __getitem__(self, index: int) -> DataPoint:
+        """인덱스로 DataPoint 조회 (0 = 가장 오래된 항목, 음수 인덱스 지원)"""
+        with self._lock:
+            if index < 0:
+                index += self._count
+            if not 0 <= index < self._count:
+                raise IndexError("CircularBuffer index out of range")
+            i = (self._head - self._count + index) % self.max_size
+            arrays = {name: array[i:i + 1] for name, array in zip(self.FIELDS, self._arrays)}
+        return self.to_points(arrays)[0]
     
     def __len__(self) -> int:
         """버퍼 크기"""
-        return len(self._buffer)
+        return self._count
+
+
+class RollingWindow:
+    """정렬 상태와 누적 합을 유지하는 이동 윈도우 (평균/표준편차/분위수/트렌드)"""
+    
+    def __init__(self, size: int):
+        self.size = size
+        # 윈도우를 앞쪽 절반(오래된 값)과 뒤쪽 절반(최신 값)으로 나눠 보관
+        self._head = deque()
+        self._tail = deque()
+        self._head_sum = 0.0
+        self._tail_sum = 0.0
+        # 정렬 상태 유지 (sortedcontainers가 없으면 bisect 정렬 리스트 사용)
+        self._sorted = SortedList() if SortedList is not None else []
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._updates = 0
+    
+    def push(self, value: float):
+        """값 추가 (밀려나는 값은 정렬 목록과 누적 합에서 제거)"""
+        # NaN/inf는 정렬 목록에서 다시 찾아 제거할 수 없으므로 받지 않음
+        if not math.isfinite(value):
+            return
+        
+        if len(self) == self.size:
+            if self._head:
+                old = self._head.popleft()
+                self._head_sum -= old
+            else:
+                old = self._tail.popleft()
+                self._tail_sum -= old
+            if SortedList is not None:
+                self._sorted.remove(old)
+            else:
+                del self._sorted[bisect.bisect_left(self._sorted, old)]
+            self._sum -= old
+            self._sumsq -= old * old
+        
+        self._tail.append(value)
+        self._tail_sum += value
+        if SortedList is not None:
+            self._sorted.add(value)
+        else:
+            bisect.insort(self._sorted, value)
+        self._sum += value
+        self._sumsq += value * value
+        
+        # 앞쪽 절반 크기를 len // 2로 유지
+        while len(self._head) < len(self) // 2:
+            moved = self._tail.popleft()
+            self._tail_sum -= moved
+            self._head.append(moved)
+            self._head_sum += moved
+        
+        # 누적 오차 방지를 위해 윈도우 크기마다 정확히 재계산
+        self._updates += 1
+        if self._updates >= self.size:
+            self._head_sum, head_sq = _fused_moments(
+                np.fromiter(self._head, dtype=np.float64, count=len(self._head)))
+            self._tail_sum, tail_sq = _fused_moments(
+                np.fromiter(self._tail, dtype=np.float64, count=len(self._tail)))
+            self._sum = self._head_sum + self._tail_sum
+            self._sumsq = head_sq + tail_sq
+            self._updates = 0
+    
+    def extend(self, values: np.ndarray):
+        """값 일괄 추가 (유한값만)"""
+        values = np.asarray(values, dtype=np.float64)
+        for value in values[np.isfinite(values)].tolist():
+            self.push(value)
+    
+    def clear(self):
+        """윈도우 초기화"""
+        self._head.clear()
+        self._tail.clear()
+        self._head_sum = 0.0
+        self._tail_sum = 0.0
+        self._sorted.clear()
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._updates = 0
+    
+    def mean(self) -> float:
+        """평균"""
+        return self._sum / len(self)
+    
+    def std(self) -> float:
+        """표준편차 (모집단)"""
+        mean = self.mean()
+        return math.sqrt(max(self._sumsq / len(self) - mean * mean, 0.0))
+    
+    def min(self) -> float:
+        """최솟값"""
+        return float(self._sorted[0])
+    
+    def max(self) -> float:
+        """최댓값"""
+        return float(self._sorted[-1])
+    
+    def percentile(self, q: float) -> float:
+        """백분위수 (np.percentile과 동일한 선형 보간)"""
+        pos = (len(self._sorted) - 1) * q / 100.0
+        lo = int(pos)
+        frac = pos - lo
+        if frac == 0.0:
+            return float(self._sorted[lo])
+        a = self._sorted[lo]
+        return float(a + (self._sorted[lo + 1] - a) * frac)
+    
+    def half_means(self) -> Tuple[float, float]:
+        """앞쪽 절반과 뒤쪽 절반의 평균 (트렌드 계산용, 2개 이상일 때)"""
+        return self._head_sum / len(self._head), self._tail_sum / len(self._tail)
+    
+    def __len__(self) -> int:
+        return len(self._head) + len(self._tail)
 
 
 class MovingAverageFilter:
@@ -146,15 +460,34 @@ class MovingAverageFilter:
     def __init__(self, window_size: int):
         self.window_size = window_size
         self.values = deque(maxlen=window_size)
+        self._sum = 0.0  # 윈도우 누적 합
     
     def filter(self, value: float) -> float:
         """필터 적용"""
+        if len(self.values) == self.window_size:
+            self._sum -= self.values[0]  # deque에서 밀려날 값 차감
         self.values.append(value)
-        return sum(self.values) / len(self.values)
+        self._sum += value
+        return self._sum / len(self.values)
+    
+    def filter_batch(self, values: np.ndarray) -> np.ndarray:
+        """필터 일괄 적용 (누적합 기반 벡터 연산)"""
+        prev = np.fromiter(self.values, dtype=np.float64, count=len(self.values))
+        data = np.concatenate((prev, values))
+        csum = np.concatenate(([0.0], np.cumsum(data)))
+        
+        end = np.arange(len(prev) + 1, len(data) + 1)
+        start = np.maximum(end - self.window_size, 0)
+        result = (csum[end] - csum[start]) / (end - start)
+        
+        self.values.extend(values.tolist())
+        self._sum = float(sum(self.values))
+        return result
     
     def reset(self):
         """필터 초기화"""
         self.values.clear()
+        self._sum = 0.0
 
 
 class MedianFilter:
@@ -163,15 +496,52 @@ class MedianFilter:
     def __init__(self, window_size: int):
         self.window_size = window_size
         self.values = deque(maxlen=window_size)
+        # 정렬 상태 유지 (sortedcontainers가 없으면 bisect 정렬 리스트 사용)
+        self._sorted = SortedList() if SortedList is not None else []
     
     def filter(self, value: float) -> float:
         """필터 적용"""
+        if len(self.values) == self.window_size:
+            self._sorted.remove(self.values[0])  # deque에서 밀려날 값 제거
         self.values.append(value)
-        return float(np.median(self.values))
+        if SortedList is not None:
+            self._sorted.add(value)
+        else:
+            bisect.insort(self._sorted, value)
+        
+        n = len(self._sorted)
+        mid = n // 2
+        if n % 2:
+            return float(self._sorted[mid])
+        return (self._sorted[mid - 1] + self._sorted[mid]) / 2.0
+    
+    def filter_batch(self, values: np.ndarray) -> np.ndarray:
+        """필터 일괄 적용"""
+        return np.fromiter(map(self.filter, values.tolist()), dtype=np.float64, count=len(values))
     
     def reset(self):
         """필터 초기화"""
         self.values.clear()
+        self._sorted.clear()
+
+
+@functools.lru_cache(maxsize=32)
+def _butter_design(order: int, normalized_cutoff: float):
+    """Butterworth 계수 계산 (파라미터별 캐시, 반환 배열은 필터 간 공유)"""
+    sos = signal.butter(order, normalized_cutoff, btype='low', output='sos')
+    b, a = signal.sos2tf(sos)
+    
+    # 구간별 계수 (b0, b1, b2, a1, a2) - a0는 1로 정규화됨
+    sections = tuple(
+        (float(b0), float(b1), float(b2), float(a1), float(a2))
+        for b0, b1, b2, _, a1, a2 in sos
+    )
+    zi_unit = signal.sosfilt_zi(sos)  # 단위 입력 정상상태
+    
+    # sos는 sosfilt가 쓰기 가능한 버퍼를 요구하므로 제외
+    for array in (b, a, zi_unit):
+        array.setflags(write=False)
+    return sos, b, a, sections, zi_unit
 
 
 class ButterworthFilter:
@@ -210,9 +580,18 @@ class ButterworthFilter:
                 self.logger = logging.getLogger(__name__)
                 self.logger.warning(f"cutoff 주파수가 너무 높습니다. {nyquist * 0.99:.2f}Hz로 조정됩니다.")
             
-            self.b, self.a = signal.butter(order, normalized_cutoff, btype='low')
-            self.z = signal.lfilter_zi(self.b, self.a)
-            self.initialized = False
+            self._design(normalized_cutoff)
+    
+    def _design(self, normalized_cutoff: float):
+        """
+        필터 계수 계산 (2차 구간(biquad) 직렬 연결, SOS)
+        
+        샘플 단위 필터링은 scipy 호출 없이 순수 Python 연산으로 처리합니다.
+        """
+        self.sos, self.b, self.a, self._sections, self._zi_unit = _butter_design(
+            self.order, float(normalized_cutoff))
+        self._state = None
+        self.initialized = False
     
     def _calculate_alpha(self, cutoff_freq: float, sampling_rate: float) -> float:
         """RC 필터의 alpha 값 계산"""
@@ -223,17 +602,19 @@ class ButterworthFilter:
     def filter(self, value: float) -> float:
         """필터 적용"""
         if self.use_scipy:
-            # scipy의 Butterworth 필터 사용
+            # Butterworth 필터 (Direct Form II Transposed biquad 직렬 연산)
             if not self.initialized:
                 # 첫 번째 값으로 초기 조건 설정
-                self.z = self.z * value
+                self._state = (self._zi_unit * value).tolist()
                 self.initialized = True
             
-            # 필터 적용
-            filtered_value, self.z = signal.lfilter(
-                self.b, self.a, [value], zi=self.z
-            )
-            return float(filtered_value[0])
+            y = value
+            for (b0, b1, b2, a1, a2), z in zip(self._sections, self._state):
+                out = b0 * y + z[0]
+                z[0] = b1 * y - a1 * out + z[1]
+                z[1] = b2 * y - a2 * out
+                y = out
+            return y
         else:
             # 간단한 RC 필터 사용 (1차 low-pass)
             if self.filtered_value is None:
@@ -245,8 +626,28 @@ class ButterworthFilter:
                 )
             return self.filtered_value
     
+    def filter_batch(self, values: np.ndarray) -> np.ndarray:
+        """필터 일괄 적용 (sosfilt 상태를 이어서 한 번에 처리)"""
+        if len(values) == 0:
+            return np.empty(0, dtype=np.float64)
+        
+        if self.use_scipy:
+            if not self.initialized:
+                self._state = (self._zi_unit * values[0]).tolist()
+                self.initialized = True
+            
+            filtered_values, state = signal.sosfilt(self.sos, values, zi=np.array(self._state))
+            self._state = state.tolist()
+            return filtered_values
+        
+        return np.fromiter(map(self.filter, values.tolist()), dtype=np.float64, count=len(values))
+    
     def update_parameters(self, cutoff_freq: float, sampling_rate: float, order: int = None):
-        """필터 파라미터 업데이트"""
+        """필터 파라미터 업데이트 (변경이 없으면 필터 상태 유지)"""
+        if (cutoff_freq == self.cutoff_freq and sampling_rate == self.sampling_rate
+                and (order is None or order == self.order)):
+            return
+        
         self.cutoff_freq = cutoff_freq
         self.sampling_rate = sampling_rate
         if order is not None:
@@ -260,9 +661,7 @@ class ButterworthFilter:
             if normalized_cutoff >= 1.0:
                 normalized_cutoff = 0.99
             
-            self.b, self.a = signal.butter(self.order, normalized_cutoff, btype='low')
-            self.z = signal.lfilter_zi(self.b, self.a)
-            self.initialized = False
+            self._design(normalized_cutoff)
         else:
             # RC 필터 alpha 재계산
             self.alpha = self._calculate_alpha(cutoff_freq, sampling_rate)
@@ -272,7 +671,7 @@ class ButterworthFilter:
         """필터 상태 초기화"""
         if self.use_scipy:
             # scipy 필터 초기화
-            self.z = signal.lfilter_zi(self.b, self.a)
+            self._state = None
             self.initialized = False
         else:
             # RC 필터 초기화
@@ -293,6 +692,7 @@ class DataProcessor(QObject):
     
     # 시그널 정의
     data_processed = pyqtSignal(DataPoint)  # 처리된 데이터
+    batch_processed = pyqtSignal(np.ndarray)  # 일괄 처리된 데이터 (최종 값 배열)
     statistics_updated = pyqtSignal(StatisticsSnapshot)  # 통계 업데이트
     outlier_detected = pyqtSignal(DataPoint)  # 이상치 감지
     buffer_overflow = pyqtSignal()  # 버퍼 오버플로우
@@ -313,6 +713,15 @@ class DataProcessor(QObject):
         # 필터 초기화
         self._init_filter()
         
+        # 이상치 검사용 이동 윈도우 (누적 합/제곱합으로 O(1) 평균/분산)
+        self._reset_outlier_window()
+        
+        # 통계용 이동 윈도우 (정렬 상태 유지, 분위수 정렬 없이 조회)
+        # 윈도우가 바뀔 때마다 리비전 증가 - 변경이 없으면 통계 재계산 생략
+        self._data_revision = 0
+        self._stats_revision = -1
+        self._reset_stat_window()
+        
         # 통계 및 상태
         self._statistics = StatisticsSnapshot()
         self._last_statistics_update = time.time()
@@ -325,8 +734,15 @@ class DataProcessor(QObject):
         # 로깅
         self.logger = logging.getLogger(__name__)
     
+    def _filter_params(self) -> tuple:
+        """필터 구성에 영향을 주는 설정값"""
+        config = self.config
+        return (config.filter_type, config.filter_window, config.butterworth_cutoff,
+                config.sampling_rate, config.butterworth_order)
+    
     def _init_filter(self):
         """필터 초기화"""
+        self._filter_key = self._filter_params()
         if self.config.filter_type == FilterType.MOVING_AVERAGE:
             self._filter = MovingAverageFilter(self.config.filter_window)
         elif self.config.filter_type == FilterType.MEDIAN:
@@ -383,6 +799,9 @@ class DataProcessor(QObject):
             
             # 버퍼에 저장
             self.buffer.append(data_point)
+            self._push_outlier_window(data_point.filtered_value or data_point.raw_value)
+            self._stat_window.push(data_point.value)
+            self._data_revision += 1
             
             # 처리 완료 시그널
             self.data_processed.emit(data_point)
@@ -398,6 +817,127 @@ class DataProcessor(QObject):
             self.processing_error.emit(f"처리 오류: {str(e)}")
             return None
     
+    def process_batch(self, values: np.ndarray,
+                      timestamps: Optional[np.ndarray] = None) -> Optional[Dict[str, np.ndarray]]:
+        """
+        원시 데이터 일괄 처리
+        
+        이상치 검사는 블록 시작 시점의 윈도우 통계를 기준으로 합니다.
+        
+        Args:
+            values: 원시값 배열
+            timestamps: 타임스탬프 배열 (없으면 현재 시각)
+            
+        Returns:
+            필드별 처리 결과 배열 (CircularBuffer.FIELDS 키)
+        """
+        try:
+            # 연속 메모리 보장 (strided 입력이면 한 번 복사하여 이후 연산이 SIMD 경로를 타도록)
+            raw = np.ascontiguousarray(values, dtype=np.float64)
+            n = len(raw)
+            if n == 0:
+                return None
+            
+            if timestamps is None:
+                timestamps = np.full(n, time.time())
+            else:
+                timestamps = np.ascontiguousarray(timestamps, dtype=np.float64)
+            
+            # 품질 점수 계산
+            quality = self._calculate_quality_scores(raw)
+            
+            # 필터링 적용 (품질 기준을 통과한 값만 필터 상태에 반영)
+            filtered = raw.copy()
+            if self._filter:
+                passed = quality >= self.config.quality_threshold
+                if passed.any():
+                    filtered[passed] = self._filter.filter_batch(raw[passed])
+            
+            # 캘리브레이션 적용
+            if self.calibration_result:
+                calibrated = self.calibration_result.apply_array(filtered)
+            else:
+                calibrated = filtered.copy()
+            
+            # 이상치 검사
+            outliers = self._outlier_mask(filtered)
+            
+            # 버퍼에 저장
+            self.buffer.extend_values(timestamps, raw, filtered, calibrated, quality)
+            self._extend_outlier_window(np.where(filtered == 0.0, raw, filtered))
+            self._stat_window.extend(calibrated)
+            self._data_revision += 1
+            
+            for i in np.flatnonzero(outliers):
+                self.outlier_detected.emit(DataPoint(
+                    timestamp=float(timestamps[i]),
+                    raw_value=float(raw[i]),
+                    filtered_value=float(filtered[i]),
+                    calibrated_value=float(calibrated[i]),
+                    quality_score=float(quality[i])
+                ))
+            
+            # 처리 완료 시그널 (블록당 1회)
+            self.batch_processed.emit(calibrated)
+            
+            return {
+                'timestamp': timestamps,
+                'raw_value': raw,
+                'filtered_value': filtered,
+                'calibrated_value': calibrated,
+                'quality_score': quality
+            }
+            
+        except Exception as e:
+            self.logger.error(f"일괄 데이터 처리 오류: {e}")
+            self.processing_error.emit(f"처리 오류: {str(e)}")
+            return None
+    
+    def process_raw_chunk(self, chunk, binary_dtype: Optional[np.dtype] = None) -> Optional[Dict[str, np.ndarray]]:
+        """
+        원시 데이터 청크 일괄 처리 (여러 줄을 한 번에 파싱하여 process_batch로 전달)
+        
+        Args:
+            chunk: 줄 단위 텍스트 (str/bytes) 또는 바이너리 샘플 (bytes)
+            binary_dtype: 바이너리 샘플 자료형 (None이면 텍스트로 파싱)
+            
+        Returns:
+            필드별 처리 결과 배열 (process_batch 참고)
+        """
+        try:
+            if binary_dtype is not None:
+                values = np.frombuffer(chunk, dtype=binary_dtype).astype(np.float64)
+            else:
+                values = self._parse_text_chunk(chunk)
+        except ValueError as e:
+            self.logger.error(f"청크 변환 오류: {e}")
+            self.processing_error.emit(f"데이터 변환 실패: {str(e)}")
+            return None
+        
+        return self.process_batch(values)
+    
+    def _parse_text_chunk(self, chunk) -> np.ndarray:
+        """줄 단위 텍스트 청크를 float64 배열로 변환 (변환 불가 줄은 제외)"""
+        text = chunk.decode('ascii', errors='replace') if isinstance(chunk, (bytes, bytearray)) else chunk
+        
+        # 빠른 경로: 공백/개행 구분 숫자를 한 번에 파싱
+        try:
+            with warnings.catch_warnings():
+                # 구버전 NumPy는 파싱 실패를 DeprecationWarning으로 알림
+                warnings.simplefilter('error', DeprecationWarning)
+                return np.fromstring(text, dtype=np.float64, sep=' ')
+        except (ValueError, DeprecationWarning):
+            pass
+        
+        # 느린 경로: 줄 단위로 변환하고 잘못된 줄은 건너뜀
+        values = []
+        for token in text.split():
+            try:
+                values.append(float(token))
+            except ValueError:
+                self.logger.error(f"데이터 변환 오류: {token}")
+        return np.array(values, dtype=np.float64)
+    
     def get_all_data(self) -> List[DataPoint]:
         """모든 데이터 반환"""
         return self.buffer.get_all()
@@ -409,6 +949,8 @@ class DataProcessor(QObject):
     def clear_buffer(self):
         """버퍼 초기화"""
         self.buffer.clear()
+        self._reset_outlier_window()
+        self._reset_stat_window()
         if self._filter:
             self._filter.reset()
         self.logger.info("데이터 버퍼 초기화됨")
@@ -430,17 +972,92 @@ class DataProcessor(QObject):
         if value < 0 or value > 10000:
             quality *= 0.5
         
-        # 급격한 변화 체크
-        recent_data = self.buffer.get_latest(5)
-        if len(recent_data) >= 3:
-            recent_values = [dp.raw_value for dp in recent_data[-3:]]
-            mean_recent = np.mean(recent_values)
+        # 급격한 변화 체크 (최근 3개 원시값, 스칼라 연산)
+        recent_values = self.buffer.get_latest_raw(3)
+        if len(recent_values) == 3:
+            a, b, c = recent_values
+            mean_recent = (a + b + c) / 3.0
+            var_recent = ((a - mean_recent) ** 2 + (b - mean_recent) ** 2 + (c - mean_recent) ** 2) / 3.0
             
-            if abs(value - mean_recent) > 3 * np.std(recent_values):
+            if abs(value - mean_recent) > 3 * math.sqrt(var_recent):
                 quality *= 0.7
         
         return max(0.0, min(1.0, quality))
     
+    def _calculate_quality_scores(self, values: np.ndarray) -> np.ndarray:
+        """
+        데이터 품질 점수 일괄 계산 (_calculate_quality_score와 동일 기준)
+        
+        Args:
+            values: 측정값 배열
+            
+        Returns:
+            품질 점수 배열 (0.0 ~ 1.0)
+        """
+        quality = np.where((values < 0) | (values > 10000), 0.5, 1.0)
+        
+        # 급격한 변화 체크 (각 값 직전 3개 원시값 기준, 블록 내 이전 값 포함)
+        prev = np.asarray(self.buffer.get_latest_raw(3), dtype=np.float64)
+        data = np.concatenate((prev, values))
+        if len(data) > 3:
+            # 3개 창을 연속 메모리 슬라이스 3개로 표현 (축 방향 strided 축약 대신 원소별 연산,
+            # 스칼라 경로와 동일한 연산 순서)
+            a, b, c = data[:-3], data[1:-2], data[2:-1]
+            first = 3 - len(prev)  # 직전 3개가 갖춰지는 첫 값의 인덱스
+            mean_recent = (a + b + c) / 3.0
+            var_recent = ((a - mean_recent) ** 2 + (b - mean_recent) ** 2 + (c - mean_recent) ** 2) / 3.0
+            jump = np.abs(values[first:] - mean_recent) > 3 * np.sqrt(var_recent)
+            quality[first:] *= np.where(jump, 0.7, 1.0)
+        
+        return np.clip(quality, 0.0, 1.0)
+    
+    def _outlier_mask(self, values: np.ndarray) -> np.ndarray:
+        """블록 시작 시점 윈도우 통계 기준 이상치 마스크"""
+        n = len(self._outlier_values)
+        if self.calibration_mode or n < 10:
+            return np.zeros(len(values), dtype=bool)
+        
+        mean_val = self._outlier_sum / n
+        var_val = self._outlier_sumsq / n - mean_val * mean_val
+        if var_val <= 0:
+            return np.zeros(len(values), dtype=bool)
+        
+        return np.abs((values - mean_val) / np.sqrt(var_val)) > self.config.outlier_threshold
+    
+    def _extend_outlier_window(self, values: np.ndarray):
+        """이상치 윈도우에 값 일괄 추가 (누적 합 정확히 재계산)"""
+        window = self._outlier_values
+        window.extend(values.tolist())
+        current = np.fromiter(window, dtype=np.float64, count=len(window))
+        self._outlier_sum, self._outlier_sumsq = _fused_moments(current)
+        self._outlier_updates = 0
+    
+    def _reset_outlier_window(self):
+        """이상치 윈도우 초기화 (버퍼의 최신 데이터로 재구성)"""
+        window = self.config.statistics_window
+        values = self.buffer.get_latest_values(window)
+        self._outlier_values = deque(values.tolist(), maxlen=window)
+        self._outlier_sum, self._outlier_sumsq = _fused_moments(values)
+        self._outlier_updates = 0
+    
+    def _push_outlier_window(self, value: float):
+        """이상치 윈도우에 값 추가 (밀려나는 값은 누적 합에서 차감)"""
+        window = self._outlier_values
+        if len(window) == window.maxlen:
+            old = window[0]
+            self._outlier_sum -= old
+            self._outlier_sumsq -= old * old
+        window.append(value)
+        self._outlier_sum += value
+        self._outlier_sumsq += value * value
+        
+        # 누적 오차 방지를 위해 윈도우 크기마다 정확히 재계산
+        self._outlier_updates += 1
+        if self._outlier_updates >= window.maxlen:
+            values = np.fromiter(window, dtype=np.float64, count=len(window))
+            self._outlier_sum, self._outlier_sumsq = _fused_moments(values)
+            self._outlier_updates = 0
+    
     def _is_outlier(self, data_point: DataPoint) -> bool:
         """
         이상치 검사
@@ -454,74 +1071,67 @@ class DataProcessor(QObject):
         # 캘리브레이션 모드에서는 이상치 감지 비활성화
         if self.calibration_mode:
             return False
-            
-        if len(self.buffer) < 10:  # 충분한 데이터가 없으면 이상치로 판단하지 않음
-            return False
         
-        recent_data = self.buffer.get_latest(self.config.statistics_window)
-        values = [dp.filtered_value or dp.raw_value for dp in recent_data]
+        n = len(self._outlier_values)
+        if n < 10:  # 충분한 데이터가 없으면 이상치로 판단하지 않음
+            return False
         
-        mean_val = np.mean(values)
-        std_val = np.std(values)
+        mean_val = self._outlier_sum / n
+        var_val = self._outlier_sumsq / n - mean_val * mean_val
         
-        if std_val == 0:
+        if var_val <= 0:
             return False
         
-        z_score = abs((data_point.filtered_value - mean_val) / std_val)
+        z_score = abs((data_point.filtered_value - mean_val) / np.sqrt(var_val))
         return z_score > self.config.outlier_threshold
     
+    def _reset_stat_window(self):
+        """통계 윈도우 초기화 (버퍼의 최신 데이터로 재구성)"""
+        values = self.buffer.get_latest_final_values(self.config.statistics_window)
+        
+        self._stat_window = RollingWindow(self.config.statistics_window)
+        self._stat_window.extend(values)
+        self._data_revision += 1
+    
     def _update_statistics(self):
         """통계 업데이트"""
-        data = self.buffer.get_latest(self.config.statistics_window)
+        window = self._stat_window
         
-        if not data:
+        # 마지막 계산 이후 새 데이터가 없으면 생략
+        if not len(window) or self._stats_revision == self._data_revision:
             return
+        self._stats_revision = self._data_revision
         
-        # 값 추출 (캘리브레이션된 값 우선)
-        values = []
-        for dp in data:
-            if dp.calibrated_value is not None:
-                values.append(dp.calibrated_value)
-            elif dp.filtered_value is not None:
-                values.append(dp.filtered_value)
+        # 통계 계산 (누적 합과 정렬 윈도우에서 바로 조회)
+        self._statistics = StatisticsSnapshot(
+            count=len(window),
+            mean=window.mean(),
+            std=window.std(),
+            min_value=window.min(),
+            max_value=window.max(),
+            median=window.percentile(50),
+            percentile_25=window.percentile(25),
+            percentile_75=window.percentile(75)
+        )
+        
+        # 트렌드 계산 (절반 구간 누적 합으로 평균 계산)
+        if len(window) >= 10:
+            mean_first, mean_second = window.half_means()
+            
+            diff_ratio = (mean_second - mean_first) / mean_first if mean_first != 0 else 0
+            
+            if diff_ratio > 0.05:
+                self._statistics.trend = "increasing"
+            elif diff_ratio < -0.05:
+                self._statistics.trend = "decreasing"
             else:
-                values.append(dp.raw_value)
+                self._statistics.trend = "stable"
         
-        # 통계 계산
+        # 시그널 발송 (연결된 슬롯의 예외가 통계 타이머를 중단시키지 않도록)
         try:
-            self._statistics = StatisticsSnapshot(
-                count=len(values),
-                mean=float(np.mean(values)),
-                std=float(np.std(values)),
-                min_value=float(np.min(values)),
-                max_value=float(np.max(values)),
-                median=float(np.median(values)),
-                percentile_25=float(np.percentile(values, 25)),
-                percentile_75=float(np.percentile(values, 75))
-            )
-            
-            # 트렌드 계산
-            if len(values) >= 10:
-                first_half = values[:len(values)//2]
-                second_half = values[len(values)//2:]
-                
-                mean_first = np.mean(first_half)
-                mean_second = np.mean(second_half)
-                
-                diff_ratio = (mean_second - mean_first) / mean_first if mean_first != 0 else 0
-                
-                if diff_ratio > 0.05:
-                    self._statistics.trend = "increasing"
-                elif diff_ratio < -0.05:
-                    self._statistics.trend = "decreasing"
-                else:
-                    self._statistics.trend = "stable"
-            
-            # 시그널 발송
             self.statistics_updated.emit(self._statistics)
-            
         except Exception as e:
-            self.logger.error(f"통계 계산 오류: {e}")
+            self.logger.error(f"통계 시그널 처리 오류: {e}")
     
     def update_config(self, new_config: ProcessingConfig):
         """
@@ -531,7 +1141,12 @@ class DataProcessor(QObject):
             new_config: 새로운 설정
         """
         self.config = new_config
-        self._init_filter()  # 필터 재초기화
+        # 필터 관련 설정이 바뀐 경우에만 재초기화 (필터 상태 유지)
+        if self._filter_params() != self._filter_key:
+            self._init_filter()
+        if self._outlier_values.maxlen != new_config.statistics_window:
+            self._reset_outlier_window()
+            self._reset_stat_window()
         self.logger.info("데이터 처리 설정 업데이트됨")
     
     def update_butterworth_filter(self, cutoff_freq: float = None, 
@@ -565,6 +1180,7 @@ class DataProcessor(QObject):
                 sampling_rate=self.config.sampling_rate,
                 order=self.config.butterworth_order
             )
+            self._filter_key = self._filter_params()
             self.logger.info(
                 f"Butterworth 필터 파라미터 업데이트: "
                 f"cutoff={self.config.butterworth_cutoff}Hz, "
@@ -0,0 +1,19 @@
+"""
+PBS 2.0 Numeric Kernels
+========================
+
+수치 연산 커널 공용 모듈
+- numba JIT 선택적 적용 (미설치 시 순수 Python/NumPy로 동작)
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """numba가 없을 때 사용하는 no-op 데코레이터"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -16,7 +16,7 @@ from typing import Optional, Callable, List, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
 import threading
-from queue import Queue, Empty
+from collections import deque
 
 import serial
 import serial.tools.list_ports as list_ports
@@ -51,28 +51,23 @@ class SerialConfig:
             raise ValueError("Timeout cannot be negative")
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
     """성능 메트릭"""
     bytes_received: int = 0
     packets_received: int = 0
     errors_count: int = 0
     connection_uptime: float = 0.0
-    last_data_time: Optional[float] = None
-    
-    @property
-    def data_rate(self) -> float:
-        """데이터 수신율 (bytes/sec)"""
-        if self.connection_uptime > 0:
-            return self.bytes_received / self.connection_uptime
-        return 0.0
+    last_data_time: Optional[float] = None  # time.monotonic() 기준
+    data_rate: float = 0.0    # 데이터 수신율 (bytes/sec, 연결 시간 갱신 시 계산)
+    packet_rate: float = 0.0  # 패킷 수신율 (packets/sec, 연결 시간 갱신 시 계산)
     
-    @property
-    def packet_rate(self) -> float:
-        """패킷 수신율 (packets/sec)"""
-        if self.connection_uptime > 0:
-            return self.packets_received / self.connection_uptime
-        return 0.0
+    def update_uptime(self, uptime: float):
+        """연결 시간 갱신 및 수신율 계산"""
+        self.connection_uptime = uptime
+        if uptime > 0:
+            self.data_rate = self.bytes_received / uptime
+            self.packet_rate = self.packets_received / uptime
 
 
 class SerialManager(QObject):
@@ -87,7 +82,8 @@ class SerialManager(QObject):
     """
     
     # 시그널 정의
-    data_received = pyqtSignal(str)  # 데이터 수신
+    data_received = pyqtSignal(str)  # 데이터 수신 (줄 단위, 호환용)
+    data_batch = pyqtSignal(list)  # 데이터 일괄 수신 (수집 주기마다 한 번)
     connection_changed = pyqtSignal(ConnectionState)  # 연결 상태 변경
     port_list_updated = pyqtSignal(list)  # 포트 목록 업데이트
     performance_updated = pyqtSignal(PerformanceMetrics)  # 성능 메트릭 업데이트
@@ -104,11 +100,12 @@ class SerialManager(QObject):
         # 성능 메트릭
         self.metrics = PerformanceMetrics()
         self._connection_start_time: Optional[float] = None
+        self._last_emitted_bytes = -1  # 마지막으로 발송한 수신 바이트 수 (변경 없으면 발송 생략)
         
         # 스레딩 및 큐
         self._running = False
         self._read_thread: Optional[threading.Thread] = None
-        self._data_queue = Queue(maxsize=10000)  # 대용량 버퍼
+        self._data_queue = deque(maxlen=10000)  # 대용량 버퍼 (가득 차면 오래된 데이터부터 제거)
         
         # 타이머 설정
         self._port_scanner = QTimer()
@@ -119,6 +116,10 @@ class SerialManager(QObject):
         self._metrics_timer.timeout.connect(self._update_metrics)
         self._metrics_timer.start(1000)  # 1초마다 메트릭 업데이트
         
+        # 수신 데이터 일괄 전달 (줄마다 스레드 간 시그널을 보내지 않음)
+        self._drain_timer = QTimer()
+        self._drain_timer.timeout.connect(self._drain_queue)
+        
         # 로깅
         self.logger = logging.getLogger(__name__)
         
@@ -160,11 +161,15 @@ class SerialManager(QObject):
         self._set_state(ConnectionState.CONNECTING)
         
         try:
+            # 읽기 타임아웃: 읽기 스레드는 블로킹 대기하되 연결 해제에는 빠르게 반응하도록
+            # 짧게 제한 (0이면 논블로킹이 되어 루프가 CPU를 점유하므로 사용하지 않음)
+            read_timeout = min(self.config.timeout, 0.1) if self.config.timeout > 0 else 0.1
+            
             # 시리얼 포트 열기
             self.serial_port = serial.Serial(
                 port=self.config.port,
                 baudrate=self.config.baudrate,
-                timeout=self.config.timeout,
+                timeout=read_timeout,
                 rtscts=self.config.rtscts,
                 parity=self.config.parity,
                 stopbits=self.config.stopbits,
@@ -174,6 +179,10 @@ class SerialManager(QObject):
             # 입력 버퍼 초기화
             self.serial_port.reset_input_buffer()
             
+            # 메트릭 초기화 (읽기 스레드가 시작 시 참조를 고정하므로 스레드 시작 전에)
+            self.metrics = PerformanceMetrics()
+            self._last_emitted_bytes = -1
+            
             # 읽기 스레드 시작
             self._running = True
             self._read_thread = threading.Thread(
@@ -182,10 +191,10 @@ class SerialManager(QObject):
                 name=f"SerialReader-{self.config.port}"
             )
             self._read_thread.start()
+            self._drain_timer.start(20)  # 20ms마다 수신 데이터 전달
             
             # 연결 시간 기록
-            self._connection_start_time = time.time()
-            self.metrics = PerformanceMetrics()  # 메트릭 초기화
+            self._connection_start_time = time.monotonic()
             
             self._set_state(ConnectionState.CONNECTED)
             self.logger.info(f"포트 {self.config.port} 연결 성공")
@@ -209,6 +218,10 @@ class SerialManager(QObject):
         # 읽기 스레드 종료 대기
         if self._read_thread and self._read_thread.is_alive():
             self._read_thread.join(timeout=2.0)
+        
+        # 남은 수신 데이터 전달
+        self._drain_timer.stop()
+        self._drain_queue()
             
         # 시리얼 포트 닫기
         if self.serial_port and self.serial_port.is_open:
@@ -258,44 +271,55 @@ class SerialManager(QObject):
         """데이터 읽기 루프 (별도 스레드에서 실행)"""
         self.logger.info("데이터 읽기 시작")
         
-        while self._running and self.serial_port and self.serial_port.is_open:
+        # 수신 누적 버퍼 (줄 단위로 분리되기 전의 원시 바이트)
+        rx_buf = bytearray()
+        
+        # 루프에서 반복 참조하는 속성을 지역 변수로 고정
+        port = self.serial_port
+        if port is None:
+            return
+        read = port.read
+        find = rx_buf.find
+        queue_append = self._data_queue.append
+        metrics = self.metrics
+        
+        while self._running and port.is_open:
             try:
-                if self.serial_port.in_waiting > 0:
-                    # 데이터 읽기
-                    raw_data = self.serial_port.readline()
-                    
-                    if raw_data:
-                        try:
-                            # 디코딩 및 정리
-                            data = raw_data.decode('utf-8', errors='ignore').strip()
-                            
-                            if data:
-                                # 메트릭 업데이트
-                                self.metrics.bytes_received += len(raw_data)
-                                self.metrics.packets_received += 1
-                                self.metrics.last_data_time = time.time()
-                                
-                                # 데이터 큐에 추가 (논블로킹)
-                                try:
-                                    self._data_queue.put_nowait(data)
-                                except:
-                                    # 큐가 가득 찬 경우 오래된 데이터 제거
-                                    try:
-                                        self._data_queue.get_nowait()
-                                        self._data_queue.put_nowait(data)
-                                    except Empty:
-                                        pass
-                                
-                                # 시그널 발송 (UI 스레드에서 처리)
-                                self.data_received.emit(data)
-                                
-                        except UnicodeDecodeError:
-                            self.metrics.errors_count += 1
-                            self.logger.debug("디코딩 오류")
-                            
-                else:
-                    # CPU 사용량 감소를 위한 작은 대기
-                    time.sleep(0.005)  # 5ms 대기
+                # 수신된 만큼 한 번에 읽기 (수신 데이터가 없으면 첫 바이트 도착 또는
+                # 읽기 타임아웃까지 블로킹 대기 - sleep 폴링 없음)
+                chunk = read(max(1, min(port.in_waiting, 4096)))
+                if not chunk:
+                    continue
+                rx_buf += chunk
+                
+                # 줄 단위 분리 (bytearray.find는 C 수준에서 검색)
+                # 검색 위치를 이어가며 처리하고, 처리한 영역은 마지막에 한 번만 삭제
+                start = 0
+                lines = 0
+                line_bytes = 0
+                with memoryview(rx_buf) as view:
+                    while True:
+                        newline = find(b'\n', start)
+                        if newline < 0:
+                            break
+                        
+                        # 복사 없이 버퍼에서 바로 디코딩 (숫자 데이터는 ASCII이므로 ASCII 고속 경로 사용)
+                        data = str(view[start:newline], 'ascii', 'ignore').strip()
+                        if data:
+                            # 데이터 큐에 추가 (UI 스레드의 타이머가 일괄 전달)
+                            queue_append(data)
+                            lines += 1
+                            line_bytes += newline + 1 - start
+                        start = newline + 1
+                
+                if start:
+                    del rx_buf[:start]
+                
+                # 메트릭 업데이트 (읽기 단위로 한 번)
+                if lines:
+                    metrics.bytes_received += line_bytes
+                    metrics.packets_received += lines
+                    metrics.last_data_time = time.monotonic()
                     
             except serial.SerialException as e:
                 self.logger.error(f"시리얼 읽기 오류: {e}")
@@ -309,6 +333,20 @@ class SerialManager(QObject):
         
         self.logger.info("데이터 읽기 종료")
     
+    def _drain_queue(self):
+        """큐에 쌓인 수신 데이터를 한 번에 전달 (UI 스레드에서 실행)"""
+        queue = self._data_queue
+        if not queue:
+            return
+        
+        batch = [queue.popleft() for _ in range(len(queue))]
+        self.data_batch.emit(batch)
+        
+        # 줄 단위 시그널은 연결된 수신자가 있을 때만 발송
+        if self.receivers(self.data_received) > 0:
+            for data in batch:
+                self.data_received.emit(data)
+    
     def _scan_ports(self):
         """포트 목록 스캔 및 업데이트"""
         try:
@@ -319,9 +357,13 @@ class SerialManager(QObject):
     
     def _update_metrics(self):
         """성능 메트릭 업데이트"""
-        if self._connection_start_time:
-            self.metrics.connection_uptime = time.time() - self._connection_start_time
-            
+        if self._connection_start_time is not None:
+            self.metrics.update_uptime(time.monotonic() - self._connection_start_time)
+        
+        # 수신량에 변화가 없으면 발송 생략 (유휴 상태에서 UI 갱신 없음)
+        if self.metrics.bytes_received == self._last_emitted_bytes:
+            return
+        self._last_emitted_bytes = self.metrics.bytes_received
         self.performance_updated.emit(self.metrics)
     
     def _set_state(self, new_state: ConnectionState):
@@ -351,13 +393,16 @@ class SerialManager(QObject):
             # QTimer가 이미 삭제된 경우 무시
             pass
         
+        try:
+            if hasattr(self, '_drain_timer') and self._drain_timer:
+                self._drain_timer.stop()
+        except RuntimeError:
+            # QTimer가 이미 삭제된 경우 무시
+            pass
+        
         # 큐 정리
         try:
-            while not self._data_queue.empty():
-                try:
-                    self._data_queue.get_nowait()
-                except Empty:
-                    break
+            self._data_queue.clear()
         except AttributeError:
             # 큐가 이미 삭제된 경우 무시
             pass
@@ -8,8 +8,8 @@ PBS 2.0 Calibration Monitor Widget
 - 품질 지표 시각화
 """
 
+import time
 import numpy as np
-from collections import deque
 from typing import Optional
 
 from PyQt6.QtWidgets import (
@@ -18,7 +18,7 @@ from PyQt6.QtWidgets import (
     QGridLayout
 )
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
-from PyQt6.QtGui import QPainter, QColor, QPen, QBrush
+from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QPixmap
 
 import matplotlib
 matplotlib.use('Qt5Agg')
@@ -26,21 +26,247 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 
+# pyqtgraph 선택적 사용 (미설치 시 matplotlib 그래프 사용)
+try:
+    import pyqtgraph as pg
+    PYQTGRAPH_AVAILABLE = True
+except ImportError:
+    PYQTGRAPH_AVAILABLE = False
 
-class RealtimeGraph(FigureCanvas):
-    """실시간 그래프 위젯"""
+from core.kernels import njit
+
+
+@njit(cache=True)
+def _window_stats(values):
+    """평균/표준편차/최소/최대를 한 번의 순회로 계산 (첫 값 기준 이동으로 상쇄 오차 방지)"""
+    n = values.shape[0]
+    shift = values[0]
+    total = 0.0
+    total_sq = 0.0
+    min_val = values[0]
+    max_val = values[0]
+    for i in range(n):
+        x = values[i]
+        d = x - shift
+        total += d
+        total_sq += d * d
+        if x < min_val:
+            min_val = x
+        elif x > max_val:
+            max_val = x
+    mean_d = total / n
+    var = total_sq / n - mean_d * mean_d
+    if var < 0.0:
+        var = 0.0
+    return shift + mean_d, np.sqrt(var), min_val, max_val
+
+
+@njit(cache=True)
+def _minmax(values):
+    """최소/최대를 한 번의 순회로 계산 (극값이 밀려났을 때 다시 탐색용)"""
+    min_val = values[0]
+    max_val = values[0]
+    for i in range(1, values.shape[0]):
+        x = values[i]
+        if x < min_val:
+            min_val = x
+        elif x > max_val:
+            max_val = x
+    return min_val, max_val
+
+
+@njit(cache=True)
+def _score_window(shift, total, total_sq, n):
+    """누적 합으로부터 (평균, 표준편차, CV%, 안정성 구간, 품질 점수) 계산"""
+    mean_d = total / n
+    var = total_sq / n - mean_d * mean_d
+    if var < 0.0:
+        var = 0.0
+    avg = shift + mean_d
+    std = np.sqrt(var)
+    cv = std / avg * 100.0 if avg != 0.0 else 0.0
+    
+    # 안정성 구간 (CalibrationMonitor._STABILITY_LEVELS 순서와 동일)
+    if cv < 1.0:
+        stability_idx = 0
+    elif cv < 2.0:
+        stability_idx = 1
+    elif cv < 5.0:
+        stability_idx = 2
+    else:
+        stability_idx = 3
+    
+    # 품질 점수 (CV 10% 이상이면 0)
+    quality = 1.0 - cv / 10.0
+    if not quality > 0.0:
+        quality = 0.0
+    return avg, std, cv, stability_idx, quality
+
+
+# JIT 워밍업 (첫 샘플 처리 시 컴파일 지연 방지)
+_window_stats(np.zeros(1))
+_minmax(np.zeros(1))
+_score_window(0.0, 0.0, 0.0, 1)
+
+
+class _RealtimeBufferMixin:
+    """실시간 그래프 공용 데이터 버퍼 / 다시 그리기 병합"""
+    
+    def _init_buffer(self, max_points: int):
+        """버퍼 및 갱신 타이머 초기화"""
+        self.max_points = max_points
+        # 링 버퍼를 두 번 기록해 항상 연속된 구간을 복사 없이 꺼낼 수 있도록 함
+        self._ybuf = np.empty(max_points * 2, dtype=np.float64)
+        self._count = 0
+        self.time_counter = 0
+        
+        # 버퍼 최소/최대 (밀려난 값이 극값일 때만 다시 탐색)
+        self._ymin = 0.0
+        self._ymax = 0.0
+        self._ylim = None  # 마지막으로 적용한 Y축 범위
+        
+        # 평균선용 누적 합 (버퍼 크기마다 정확히 재계산)
+        self._sum = 0.0
+        self._sum_updates = 0
+        
+        # 다시 그리기 병합 (샘플마다 그리지 않고 최대 ~30Hz로 갱신)
+        self._dirty = False
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(33)
+        self._redraw_timer.timeout.connect(self._flush)
+        
+        # 표시 간격 (그리기가 느리면 k개마다 한 점만 그림, 통계/버퍼는 모든 샘플 유지)
+        self._disp_skip = 1
+        self._max_disp_skip = max(1, max_points // 100)
+    
+    def add_data_point(self, value: float):
+        """데이터 포인트 추가"""
+        self.add_data_points(np.array([value], dtype=np.float64))
+    
+    def add_data_points(self, values: np.ndarray):
+        """데이터 포인트 일괄 추가"""
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        n = values.shape[0]
+        if n == 0:
+            return
+        size = self.max_points
+        
+        # 버퍼보다 많이 들어오면 마지막 max_points개만 남음
+        kept = values[-size:]
+        pos = (self.time_counter + (n - kept.shape[0]) + np.arange(kept.shape[0])) % size
+        filled = self._count
+        evicted = self._ybuf[pos[max(0, size - filled):]] if n < size else None
+        self._ybuf[pos] = kept
+        self._ybuf[pos + size] = kept
+        self.time_counter += n
+        self._count = min(filled + n, size)
+        
+        self._sum_updates += n
+        if evicted is None or self._sum_updates >= size:
+            # 누적 오차 방지를 위해 버퍼 크기마다 정확히 재계산
+            window = self._window()
+            self._sum = float(window.sum())
+            self._ymin, self._ymax = _minmax(window)
+            self._sum_updates = 0
+        else:
+            self._sum += float(kept.sum()) - float(evicted.sum())
+            
+            # 밀려난 값이 극값이었을 때만 다시 탐색
+            if filled == 0:
+                self._ymin, self._ymax = _minmax(kept)
+            elif evicted.size and ((evicted == self._ymin).any() or (evicted == self._ymax).any()):
+                self._ymin, self._ymax = _minmax(self._window())
+            else:
+                batch_min, batch_max = _minmax(kept)
+                if batch_min < self._ymin:
+                    self._ymin = batch_min
+                if batch_max > self._ymax:
+                    self._ymax = batch_max
+        
+        # 실제 그리기는 타이머에서 한 번에 처리
+        self._dirty = True
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start()
+    
+    def _flush(self):
+        """누적된 데이터로 그래프 갱신"""
+        if not self._dirty:
+            return
+        self._dirty = False
+        
+        if self._count > 0:
+            start = time.perf_counter()
+            self._render()
+            elapsed = time.perf_counter() - start
+            
+            # 그리기 시간에 따라 표시 간격 자동 조정
+            if elapsed > 0.016 and self._disp_skip < self._max_disp_skip:
+                self._disp_skip *= 2
+            elif elapsed < 0.004 and self._disp_skip > 1:
+                self._disp_skip //= 2
+    
+    def _plot_data(self):
+        """그래프에 표시할 (x, y) 데이터 (최신 샘플은 항상 포함)"""
+        x = self._time_axis()
+        y = self._window()
+        k = self._disp_skip
+        if k > 1:
+            first = (self._count - 1) % k
+            return x[first::k], y[first::k]
+        return x, y
+    
+    def _window(self) -> np.ndarray:
+        """현재 버퍼 값 (오래된 순, 복사 없는 뷰)"""
+        start = self.time_counter - self._count
+        if start == 0:
+            return self._ybuf[:self._count]
+        pos = start % self.max_points
+        return self._ybuf[pos:pos + self._count]
+    
+    def _time_axis(self) -> np.ndarray:
+        """현재 버퍼의 샘플 번호"""
+        return np.arange(self.time_counter - self._count, self.time_counter, dtype=np.float64)
+    
+    def _ylim_update(self):
+        """Y축 범위를 바꿔야 할 때만 (하한, 상한) 반환 (범위의 5% 이내 축소는 무시)"""
+        lo = self._ymin * 0.9
+        hi = self._ymax * 1.1
+        if self._ylim is not None:
+            cur_lo, cur_hi = self._ylim
+            tol = (cur_hi - cur_lo) * 0.05
+            if cur_lo <= lo <= cur_lo + tol and cur_hi - tol <= hi <= cur_hi:
+                return None
+        self._ylim = (lo, hi)
+        return self._ylim
+    
+    def _reset_buffer(self):
+        """버퍼 초기화 (대기 중인 갱신 취소)"""
+        self._redraw_timer.stop()
+        self._dirty = False
+        self._count = 0
+        self.time_counter = 0
+        self._ylim = None
+        self._sum = 0.0
+        self._sum_updates = 0
+
+
+class RealtimeGraph(_RealtimeBufferMixin, FigureCanvas):
+    """실시간 그래프 위젯 (matplotlib)"""
     
     def __init__(self, parent=None, max_points=500):
         self.figure = Figure(figsize=(8, 4))
         super().__init__(self.figure)
         self.setParent(parent)
         
-        self.max_points = max_points
-        self.data_buffer = deque(maxlen=max_points)
-        self.time_buffer = deque(maxlen=max_points)
-        self.time_counter = 0
-        
+        self._ref_lines = {}
+        self._background = None  # 블리팅용 배경 (축/격자/범례)
+        self._last_xlim_sample = 0  # 마지막으로 X축 범위를 옮긴 시점의 샘플 번호
+        self._init_buffer(max_points)
         self._init_plot()
+        
+        # 전체 그리기가 끝날 때마다 배경 저장
+        self.mpl_connect('draw_event', self._on_draw)
     
     def _init_plot(self):
         """플롯 초기화"""
@@ -51,8 +277,9 @@ class RealtimeGraph(FigureCanvas):
         self.ax.grid(True, alpha=0.3)
         
         # 라인 객체 생성
-        self.line, = self.ax.plot([], [], 'b-', linewidth=1.5)
-        self.avg_line = self.ax.axhline(y=0, color='r', linestyle='--', alpha=0.5, label='Average')
+        # (animated: 전체 그리기에서 제외하고 블리팅으로만 그림)
+        self.line, = self.ax.plot([], [], 'b-', linewidth=1.5, animated=True)
+        self.avg_line = self.ax.axhline(y=0, color='r', linestyle='--', alpha=0.5, label='Average', animated=True)
         
         # 범위 설정
         self.ax.set_xlim(0, self.max_points)
@@ -61,36 +288,52 @@ class RealtimeGraph(FigureCanvas):
         self.ax.legend(loc='upper right')
         self.figure.tight_layout()
     
-    def add_data_point(self, value: float):
-        """데이터 포인트 추가"""
-        self.data_buffer.append(value)
-        self.time_buffer.append(self.time_counter)
-        self.time_counter += 1
-        
-        # 그래프 업데이트
-        if len(self.data_buffer) > 0:
-            self.line.set_data(list(self.time_buffer), list(self.data_buffer))
-            
-            # 평균선 업데이트
-            avg_value = np.mean(self.data_buffer)
-            self.avg_line.set_ydata([avg_value, avg_value])
+    def _on_draw(self, event):
+        """전체 그리기 후 배경 저장 및 데이터 라인 그리기"""
+        self._background = self.copy_from_bbox(self.figure.bbox)
+        self._draw_animated()
+    
+    def _draw_animated(self):
+        """데이터 라인과 평균선 그리기"""
+        self.ax.draw_artist(self.line)
+        self.ax.draw_artist(self.avg_line)
+    
+    def _render(self):
+        """그래프 갱신 (축 범위가 바뀔 때만 전체 그리기, 그 외에는 블리팅)"""
+        self.line.set_data(*self._plot_data())
+        
+        # 평균선 업데이트
+        avg_value = self._sum / self._count
+        self.avg_line.set_ydata([avg_value, avg_value])
+        
+        # 축 범위 자동 조정
+        limits_changed = False
+        if self._count > 1:
+            ylim = self._ylim_update()
+            if ylim is not None:
+                self.ax.set_ylim(*ylim)
+                limits_changed = True
             
-            # 축 범위 자동 조정
-            if len(self.data_buffer) > 1:
-                y_min = min(self.data_buffer) * 0.9
-                y_max = max(self.data_buffer) * 1.1
-                self.ax.set_ylim(y_min, y_max)
-                
-                if self.time_counter > self.max_points:
+            # 한 픽셀 이상 움직일 때만 X축 범위 이동
+            if self.time_counter > self.max_points:
+                axis_width = max(int(self.ax.bbox.width), 1)
+                min_step = max(1, self.max_points // axis_width)
+                if self.time_counter - self._last_xlim_sample >= min_step:
                     self.ax.set_xlim(self.time_counter - self.max_points, self.time_counter)
-            
+                    self._last_xlim_sample = self.time_counter
+                    limits_changed = True
+        
+        if limits_changed or self._background is None:
             self.draw()
+        else:
+            self.restore_region(self._background)
+            self._draw_animated()
+            self.blit(self.ax.bbox)
     
     def clear_data(self):
         """데이터 초기화"""
-        self.data_buffer.clear()
-        self.time_buffer.clear()
-        self.time_counter = 0
+        self._reset_buffer()
+        self._last_xlim_sample = 0
         self.line.set_data([], [])
         self.avg_line.set_ydata([0, 0])
         self.ax.set_xlim(0, self.max_points)
@@ -98,37 +341,150 @@ class RealtimeGraph(FigureCanvas):
     
     def set_reference_line(self, value: float, label: str = "Reference"):
         """기준선 설정"""
-        # 기존 기준선 제거
-        for line in self.ax.lines:
-            if line.get_label() == label:
-                line.remove()
-        
-        # 새 기준선 추가
-        self.ax.axhline(y=value, color='g', linestyle=':', alpha=0.7, label=label)
-        self.ax.legend(loc='upper right')
+        # 같은 라벨의 기준선이 있으면 위치만 갱신 (범례 재생성 없음)
+        line = self._ref_lines.get(label)
+        if line is not None:
+            line.set_ydata([value, value])
+        else:
+            self._ref_lines[label] = self.ax.axhline(
+                y=value, color='g', linestyle=':', alpha=0.7, label=label
+            )
+            self.ax.legend(loc='upper right')
         self.draw()
 
 
+if PYQTGRAPH_AVAILABLE:
+    class PgRealtimeGraph(_RealtimeBufferMixin, pg.PlotWidget):
+        """실시간 그래프 위젯 (pyqtgraph)"""
+        
+        def __init__(self, parent=None, max_points=500):
+            super().__init__(parent, background='w')
+            
+            self._ref_lines = {}
+            self._init_buffer(max_points)
+            self._init_plot()
+        
+        def _init_plot(self):
+            """플롯 초기화"""
+            self.setLabel('bottom', 'Time (samples)')
+            self.setLabel('left', 'Sensor Value')
+            self.setTitle('Real-time Sensor Data')
+            self.showGrid(x=True, y=True, alpha=0.3)
+            
+            # 라인 객체 생성
+            self.curve = self.plot(pen=pg.mkPen('b', width=1.5))
+            self.avg_line = pg.InfiniteLine(
+                pos=0, angle=0,
+                pen=pg.mkPen('r', style=Qt.PenStyle.DashLine),
+                label='Average', labelOpts={'position': 0.05}
+            )
+            self.addItem(self.avg_line, ignoreBounds=True)
+            
+            # 범위 설정
+            self.setXRange(0, self.max_points, padding=0)
+            self.setYRange(0, 100, padding=0)  # 초기 범위
+        
+        def _render(self):
+            """그래프 갱신"""
+            self.curve.setData(*self._plot_data())
+            
+            # 평균선 업데이트
+            self.avg_line.setValue(self._sum / self._count)
+            
+            # 축 범위 자동 조정
+            if self._count > 1:
+                ylim = self._ylim_update()
+                if ylim is not None:
+                    self.setYRange(*ylim, padding=0)
+                
+                if self.time_counter > self.max_points:
+                    self.setXRange(self.time_counter - self.max_points, self.time_counter, padding=0)
+        
+        def clear_data(self):
+            """데이터 초기화"""
+            self._reset_buffer()
+            self.curve.setData([], [])
+            self.avg_line.setValue(0)
+            self.setXRange(0, self.max_points, padding=0)
+        
+        def set_reference_line(self, value: float, label: str = "Reference"):
+            """기준선 설정"""
+            # 기존 기준선 제거
+            old_line = self._ref_lines.pop(label, None)
+            if old_line is not None:
+                self.removeItem(old_line)
+            
+            # 새 기준선 추가
+            line = pg.InfiniteLine(
+                pos=value, angle=0,
+                pen=pg.mkPen('g', style=Qt.PenStyle.DotLine),
+                label=label, labelOpts={'position': 0.95}
+            )
+            self.addItem(line, ignoreBounds=True)
+            self._ref_lines[label] = line
+
+
 class QualityIndicator(QWidget):
     """품질 지표 위젯"""
     
+    # 그리기 객체 캐시 (paintEvent마다 생성하지 않음)
+    _BACKGROUND = QColor(240, 240, 240)
+    _COLOR_GOOD = QColor(0, 200, 0)  # 녹색
+    _COLOR_OK = QColor(255, 165, 0)  # 주황색
+    _COLOR_BAD = QColor(255, 0, 0)  # 빨간색
+    _PEN_GOOD = QPen(_COLOR_GOOD, 3)
+    _PEN_OK = QPen(_COLOR_OK, 3)
+    _PEN_BAD = QPen(_COLOR_BAD, 3)
+    _BRUSH_GOOD = QBrush(_COLOR_GOOD, Qt.BrushStyle.Dense6Pattern)
+    _BRUSH_OK = QBrush(_COLOR_OK, Qt.BrushStyle.Dense6Pattern)
+    _BRUSH_BAD = QBrush(_COLOR_BAD, Qt.BrushStyle.Dense6Pattern)
+    _PEN_TEXT = QPen(Qt.GlobalColor.black, 2)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.quality_score = 0.0
         self.setMinimumSize(100, 100)
+        
+        # 정수 퍼센트별로 그려둔 이미지 캐시 (크기가 바뀌면 비움)
+        self._percent = 0
+        self._pixmap_cache = {}
     
     def set_quality(self, score: float):
         """품질 점수 설정 (0.0 ~ 1.0)"""
         self.quality_score = max(0.0, min(1.0, score))
-        self.update()
+        
+        # 표시는 정수 퍼센트 단위이므로 바뀌었을 때만 다시 그림
+        percent = int(round(self.quality_score * 100))
+        if percent != self._percent:
+            self._percent = percent
+            self.update()
+    
+    def resizeEvent(self, event):
+        """크기 변경 시 캐시 초기화"""
+        self._pixmap_cache.clear()
+        super().resizeEvent(event)
     
     def paintEvent(self, event):
         """페인트 이벤트"""
+        pixmap = self._pixmap_cache.get(self._percent)
+        if pixmap is None:
+            pixmap = self._render_pixmap(self._percent)
+            self._pixmap_cache[self._percent] = pixmap
+        
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
+    
+    def _render_pixmap(self, percent: int) -> QPixmap:
+        """지정한 퍼센트의 인디케이터 이미지 생성"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # 배경
-        painter.fillRect(self.rect(), QColor(240, 240, 240))
+        painter.fillRect(self.rect(), self._BACKGROUND)
         
         # 원형 인디케이터
         center_x = self.width() // 2
@@ -136,19 +492,19 @@ class QualityIndicator(QWidget):
         radius = min(self.width(), self.height()) // 3
         
         # 품질에 따른 색상
-        if self.quality_score >= 0.9:
-            color = QColor(0, 200, 0)  # 녹색
-        elif self.quality_score >= 0.7:
-            color = QColor(255, 165, 0)  # 주황색
+        if percent >= 90:
+            pen, brush = self._PEN_GOOD, self._BRUSH_GOOD
+        elif percent >= 70:
+            pen, brush = self._PEN_OK, self._BRUSH_OK
         else:
-            color = QColor(255, 0, 0)  # 빨간색
+            pen, brush = self._PEN_BAD, self._BRUSH_BAD
         
         # 원 그리기
-        painter.setPen(QPen(color, 3))
-        painter.setBrush(QBrush(color, Qt.BrushStyle.Dense6Pattern))
+        painter.setPen(pen)
+        painter.setBrush(brush)
         
         # 품질 점수에 따른 각도
-        angle = int(360 * self.quality_score)
+        angle = 360 * percent // 100
         painter.drawPie(
             center_x - radius, center_y - radius,
             radius * 2, radius * 2,
@@ -156,12 +512,14 @@ class QualityIndicator(QWidget):
         )
         
         # 텍스트
-        painter.setPen(QPen(Qt.GlobalColor.black, 2))
+        painter.setPen(self._PEN_TEXT)
         painter.drawText(
             self.rect(),
             Qt.AlignmentFlag.AlignCenter,
-            f"{self.quality_score * 100:.0f}%"
+            f"{percent}%"
         )
+        painter.end()
+        return pixmap
 
 
 class CalibrationMonitor(QWidget):
@@ -171,12 +529,29 @@ class CalibrationMonitor(QWidget):
     실시간 센서 데이터와 품질 지표를 시각화
     """
     
+    STATS_WINDOW = 100  # 통계 계산에 사용하는 최근 샘플 수
+    
+    # 안정성 구간 (표시 문자열, 스타일시트) - CV% 1/2/5 기준, 스타일시트는 미리 생성
+    _STABILITY_LEVELS = (
+        ("매우 안정", "color: green; font-weight: bold;"),
+        ("안정", "color: blue; font-weight: bold;"),
+        ("보통", "color: orange; font-weight: bold;"),
+        ("불안정", "color: red; font-weight: bold;"),
+    )
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
         self.current_weight = 0.0
         self.sample_count = 0
-        self.readings = []
+        
+        # 최근 샘플 링 버퍼 (sample_count가 쓰기 위치)
+        self._buf = np.empty(self.STATS_WINDOW, dtype=np.float64)
+        self._reset_running_stats()
+        self._stability_idx = None  # 현재 표시 중인 안정성 구간
+        self._label_texts = {}  # 라벨별 마지막 표시 문자열
+        self._stat_skip = 5  # 통계 표시 갱신 간격 (샘플 수)
+        self._stats_cache = None  # (sample_count, 통계 dict) - get_statistics 재사용
         
         self._init_ui()
     
@@ -232,7 +607,7 @@ class CalibrationMonitor(QWidget):
         # 실시간 그래프
         graph_group = QGroupBox("실시간 센서 데이터")
         graph_layout = QVBoxLayout()
-        self.graph = RealtimeGraph()
+        self.graph = PgRealtimeGraph() if PYQTGRAPH_AVAILABLE else RealtimeGraph()
         graph_layout.addWidget(self.graph)
         graph_group.setLayout(graph_layout)
         layout.addWidget(graph_group)
@@ -283,64 +658,138 @@ class CalibrationMonitor(QWidget):
     
     def add_sensor_reading(self, value: float):
         """센서 읽기 값 추가"""
-        self.readings.append(value)
-        self.sample_count += 1
+        self.add_sensor_readings(np.array([value], dtype=np.float64))
+    
+    def add_sensor_readings(self, values: np.ndarray):
+        """센서 읽기 값 일괄 추가 (버퍼/통계/그래프/UI 갱신을 한 번에 처리)"""
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        if values.shape[0] == 0:
+            return
+        prev_count = self.sample_count
+        self._push_readings(values)
         
         # UI 업데이트
         self.sample_label.setText(str(self.sample_count))
-        self.graph.add_data_point(value)
+        self.graph.add_data_points(values)
         
-        # 통계 업데이트
-        self._update_statistics()
+        # 통계 표시는 _stat_skip 샘플마다 갱신 (첫 샘플은 즉시)
+        if prev_count == 0 or prev_count // self._stat_skip != self.sample_count // self._stat_skip:
+            self._update_statistics()
+    
+    def _reset_running_stats(self):
+        """누적 통계 초기화"""
+        # 합계는 기준값(_shift)과의 차이로 누적 (제곱합 상쇄 오차 방지)
+        self._shift = 0.0
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._min = 0.0
+        self._max = 0.0
+        self._updates = 0
+    
+    def _push_readings(self, values: np.ndarray):
+        """링 버퍼에 값 추가 및 누적 통계 갱신 (윈도우 전체를 다시 계산하지 않음)"""
+        size = self.STATS_WINDOW
+        n = values.shape[0]
+        filled = min(self.sample_count, size)
+        
+        # 윈도우보다 많이 들어오면 마지막 STATS_WINDOW개만 남음
+        kept = values[-size:]
+        pos = (self.sample_count + (n - kept.shape[0]) + np.arange(kept.shape[0])) % size
+        evicted = self._buf[pos[max(0, size - filled):]] if n < size else None
+        self._buf[pos] = kept
+        self.sample_count += n
+        
+        self._updates += n
+        if evicted is None or filled == 0 or self._updates >= size:
+            # 누적 오차 방지를 위해 윈도우 크기마다 정확히 재계산 (기준값을 평균으로 재설정)
+            self._resync_running_stats()
+            return
+        
+        d = kept - self._shift
+        self._sum += float(d.sum())
+        self._sumsq += float(d @ d)
+        if evicted.size:
+            d = evicted - self._shift
+            self._sum -= float(d.sum())
+            self._sumsq -= float(d @ d)
+        
+        # 최소/최대는 밀려난 값이 극값이었을 때만 다시 탐색
+        if evicted.size and ((evicted == self._min).any() or (evicted == self._max).any()):
+            self._min, self._max = _minmax(self._window())
+        else:
+            batch_min, batch_max = _minmax(kept)
+            if batch_min < self._min:
+                self._min = batch_min
+            if batch_max > self._max:
+                self._max = batch_max
+    
+    def _resync_running_stats(self):
+        """현재 윈도우로 누적 통계를 정확히 다시 계산"""
+        window = self._window()
+        avg, std, self._min, self._max = _window_stats(window)
+        self._shift = avg
+        self._sum = 0.0
+        self._sumsq = window.shape[0] * std * std
+        self._updates = 0
+    
+    def _current_stats(self):
+        """현재 윈도우의 (평균, 표준편차, CV%, 안정성 구간, 품질 점수)"""
+        n = min(self.sample_count, self.STATS_WINDOW)
+        return _score_window(self._shift, self._sum, self._sumsq, n)
+    
+    def _window(self) -> np.ndarray:
+        """통계용 최근 샘플 (순서 무관, 복사 없음)"""
+        return self._buf[:min(self.sample_count, self.STATS_WINDOW)]
+    
+    def _recent_readings(self) -> np.ndarray:
+        """최근 샘플을 시간 순서로 반환"""
+        if self.sample_count <= self.STATS_WINDOW:
+            return self._buf[:self.sample_count].copy()
+        head = self.sample_count % self.STATS_WINDOW
+        return np.concatenate((self._buf[head:], self._buf[:head]))
     
     def _update_statistics(self):
         """통계 정보 업데이트"""
-        if not self.readings:
+        if not self.sample_count:
             return
         
         # 최근 100개 샘플만 사용
-        recent_readings = self.readings[-100:]
-        
-        avg = np.mean(recent_readings)
-        std = np.std(recent_readings)
-        min_val = np.min(recent_readings)
-        max_val = np.max(recent_readings)
-        
-        # CV% 계산
-        cv = (std / avg * 100) if avg != 0 else 0
-        
-        # UI 업데이트
-        self.avg_label.setText(f"{avg:.2f}")
-        self.std_label.setText(f"{std:.4f}")
-        self.min_label.setText(f"{min_val:.2f}")
-        self.max_label.setText(f"{max_val:.2f}")
-        self.cv_label.setText(f"{cv:.2f}%")
-        
-        # 안정성 평가
-        if cv < 1.0:
-            stability = "매우 안정"
-            color = "green"
-        elif cv < 2.0:
-            stability = "안정"
-            color = "blue"
-        elif cv < 5.0:
-            stability = "보통"
-            color = "orange"
-        else:
-            stability = "불안정"
-            color = "red"
-        
-        self.stability_label.setText(stability)
-        self.stability_label.setStyleSheet(f"color: {color}; font-weight: bold;")
+        avg, std, cv, idx, quality_score = self._current_stats()
+        self._stats_cache = (self.sample_count, {
+            'average': avg,
+            'std': std,
+            'min': self._min,
+            'max': self._max,
+            'cv_percentage': cv,
+            'sample_count': self.sample_count,
+        })
+        
+        # UI 업데이트 (표시 문자열이 바뀐 라벨만)
+        self._set_label_text(self.avg_label, "%.2f" % avg)
+        self._set_label_text(self.std_label, "%.4f" % std)
+        self._set_label_text(self.min_label, "%.2f" % self._min)
+        self._set_label_text(self.max_label, "%.2f" % self._max)
+        self._set_label_text(self.cv_label, "%.2f%%" % cv)
+        
+        # 안정성 평가 (구간이 바뀔 때만 스타일시트 적용)
+        if idx != self._stability_idx:
+            stability, style = self._STABILITY_LEVELS[idx]
+            self.stability_label.setText(stability)
+            self.stability_label.setStyleSheet(style)
+            self._stability_idx = idx
         
-        # 품질 점수 계산 (CV 기반)
-        quality_score = max(0, 1 - cv / 10)  # CV 10% 이상이면 품질 0
         self.quality_indicator.set_quality(quality_score)
     
+    def _set_label_text(self, label: QLabel, text: str):
+        """이전과 다를 때만 라벨 문자열 갱신"""
+        if self._label_texts.get(label) != text:
+            label.setText(text)
+            self._label_texts[label] = text
+    
     def clear_data(self):
         """데이터 초기화"""
-        self.readings.clear()
         self.sample_count = 0
+        self._reset_running_stats()
         self.sample_label.setText("0")
         self.graph.clear_data()
         
@@ -351,23 +800,26 @@ class CalibrationMonitor(QWidget):
         self.max_label.setText("0.0")
         self.cv_label.setText("0.0")
         self.stability_label.setText("Waiting")
+        self._stability_idx = None
+        self._label_texts.clear()
+        self._stats_cache = None
         self.quality_indicator.set_quality(0.0)
     
     def get_statistics(self) -> dict:
         """현재 통계 정보 반환"""
-        if not self.readings:
+        if not self.sample_count:
             return {}
         
-        recent_readings = self.readings[-100:]
-        avg = np.mean(recent_readings)
-        std = np.std(recent_readings)
-        
-        return {
-            'average': avg,
-            'std': std,
-            'min': np.min(recent_readings),
-            'max': np.max(recent_readings),
-            'cv_percentage': (std / avg * 100) if avg != 0 else 0,
-            'sample_count': self.sample_count,
-            'readings': recent_readings
-        }
\ No newline at end of file
+        # 마지막 통계 갱신 이후 샘플이 없으면 그 결과를 재사용
+        if self._stats_cache is None or self._stats_cache[0] != self.sample_count:
+            avg, std, cv, _, _ = self._current_stats()
+            self._stats_cache = (self.sample_count, {
+                'average': avg,
+                'std': std,
+                'min': self._min,
+                'max': self._max,
+                'cv_percentage': cv,
+                'sample_count': self.sample_count,
+            })
+        
+        return dict(self._stats_cache[1], readings=self._recent_readings().tolist())
\ No newline at end of file
@@ -7,9 +7,10 @@ Calibration wizard - QWizard-based step-by-step interface
 
 import logging
 import time
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from dataclasses import dataclass
 
+import numpy as np
 from PyQt6.QtWidgets import (
     QWizard, QWizardPage, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QProgressBar,
@@ -138,11 +139,20 @@ class IntroductionPage(QWizardPage):
 class WeightSettingsPage(QWizardPage):
     """Weight Settings Page"""
     
+    _CUMULATIVE_STYLE_ZERO = "background-color: #f0f0f0; padding: 4px; border-radius: 2px; color: #666;"
+    _CUMULATIVE_STYLE_NONZERO = (
+        "background-color: #e8f5e8; padding: 4px; border-radius: 2px; color: #2c5f2d; font-weight: bold;"
+    )
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setTitle("Reference Weight Settings")
         self.setSubTitle("Set reference weights for calibration")
         
+        # Per-row widgets cached at creation (avoids cellWidget lookups on every change)
+        self._rows: List[Tuple[QCheckBox, QDoubleSpinBox, QLabel, QTableWidgetItem]] = []
+        self._cumulative_nonzero: List[Optional[bool]] = []
+        
         self._init_ui()
     
     def _init_ui(self):
@@ -219,6 +229,7 @@ class WeightSettingsPage(QWizardPage):
             desc_item = QTableWidgetItem(desc)
             desc_item.setFlags(desc_item.flags() | Qt.ItemFlag.ItemIsEditable)
             self.weight_table.setItem(row, 3, desc_item)
+            self._cache_row_widgets(check, weight_spin, cumulative_label, desc_item)
 
         # Calculate initial cumulative weights
         self._update_cumulative_weights()
@@ -265,35 +276,36 @@ class WeightSettingsPage(QWizardPage):
         
         self.setLayout(layout)
     
+    def _cache_row_widgets(self, check: QCheckBox, weight_spin: QDoubleSpinBox,
+                           cumulative_label: QLabel, desc_item: QTableWidgetItem):
+        """Remember row widgets (kept in table row order)"""
+        self._rows.append((check, weight_spin, cumulative_label, desc_item))
+        self._cumulative_nonzero.append(None)
+    
     def _update_cumulative_weights(self):
         """Update cumulative weights"""
-        cumulative = 0.0
-
-        for row in range(self.weight_table.rowCount()):
-            # Get weight to add
-            weight_spin = self.weight_table.cellWidget(row, 1)
-            if weight_spin:
-                if row == 0:
-                    # First row is always 0
-                    cumulative = 0.0
-                else:
-                    # Accumulate
-                    cumulative += weight_spin.value()
-
-                # Update cumulative weight label
-                cumulative_label = self.weight_table.cellWidget(row, 2)
-                if cumulative_label:
-                    cumulative_label.setText(f"{cumulative:.2f} g")
-
-                    # Color distinction (based on weight)
-                    if cumulative == 0.0:
-                        cumulative_label.setStyleSheet(
-                            "background-color: #f0f0f0; padding: 4px; border-radius: 2px; color: #666;"
-                        )
-                    else:
-                        cumulative_label.setStyleSheet(
-                            "background-color: #e8f5e8; padding: 4px; border-radius: 2px; color: #2c5f2d; font-weight: bold;"
-                        )
+        if not self._rows:
+            return
+
+        # First row is always 0, the rest accumulate
+        values = np.fromiter(
+            (weight_spin.value() for _, weight_spin, _, _ in self._rows),
+            dtype=np.float64, count=len(self._rows)
+        )
+        values[0] = 0.0
+        cumulative = np.cumsum(values)
+
+        for row, weight in enumerate(cumulative.tolist()):
+            cumulative_label = self._rows[row][2]
+            cumulative_label.setText(f"{weight:.2f} g")
+
+            # Color distinction (based on weight), restyled only when the state flips
+            nonzero = weight != 0.0
+            if nonzero != self._cumulative_nonzero[row]:
+                cumulative_label.setStyleSheet(
+                    self._CUMULATIVE_STYLE_NONZERO if nonzero else self._CUMULATIVE_STYLE_ZERO
+                )
+                self._cumulative_nonzero[row] = nonzero
     
     def _add_weight_row(self):
         """Add weight row"""
@@ -325,6 +337,7 @@ class WeightSettingsPage(QWizardPage):
         desc_item = QTableWidgetItem(f"Step {row + 1}: Additional weight")
         desc_item.setFlags(desc_item.flags() | Qt.ItemFlag.ItemIsEditable)
         self.weight_table.setItem(row, 3, desc_item)
+        self._cache_row_widgets(check, weight_spin, cumulative_label, desc_item)
 
         # Update cumulative weights
         self._update_cumulative_weights()
@@ -352,6 +365,8 @@ class WeightSettingsPage(QWizardPage):
         # Delete in reverse order (to prevent index change)
         for row in sorted(selected_rows, reverse=True):
             self.weight_table.removeRow(row)
+            del self._rows[row]
+            del self._cumulative_nonzero[row]
 
         # Keep minimum 2 rows (zero point + at least 1)
         if self.weight_table.rowCount() < 2:
@@ -360,43 +375,35 @@ class WeightSettingsPage(QWizardPage):
         # Recalculate cumulative weights
         self._update_cumulative_weights()
     
+    def _selected_weights(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (cumulative, individual) weights of the checked rows"""
+        count = len(self._rows)
+        values = np.fromiter(
+            (weight_spin.value() for _, weight_spin, _, _ in self._rows),
+            dtype=np.float64, count=count
+        )
+        checked = np.fromiter(
+            (check.isChecked() for check, _, _, _ in self._rows),
+            dtype=bool, count=count
+        )
+        if count:
+            values[0] = 0.0  # Zero point
+
+        # Unchecked rows are not added to the cumulative weight
+        cumulative = np.cumsum(np.where(checked, values, 0.0))
+        return np.round(cumulative[checked], 2), np.round(values[checked], 2)
+    
     def get_weights(self) -> List[float]:
         """Return selected cumulative weight list"""
-        weights = []
-        cumulative = 0.0
-
-        for row in range(self.weight_table.rowCount()):
-            check = self.weight_table.cellWidget(row, 0)
-            if check and check.isChecked():
-                weight_spin = self.weight_table.cellWidget(row, 1)
-                if weight_spin:
-                    if row == 0:
-                        cumulative = 0.0
-                    else:
-                        cumulative += weight_spin.value()
-                    weights.append(round(cumulative, 2))
-
-        return weights
+        return self._selected_weights()[0].tolist()
 
     def get_individual_weights(self) -> List[float]:
         """Return selected individual weight list (single weights)"""
-        individual_weights = []
-
-        for row in range(self.weight_table.rowCount()):
-            check = self.weight_table.cellWidget(row, 0)
-            if check and check.isChecked():
-                weight_spin = self.weight_table.cellWidget(row, 1)
-                if weight_spin:
-                    if row == 0:
-                        individual_weights.append(0.0)  # Zero point
-                    else:
-                        individual_weights.append(round(weight_spin.value(), 2))
-
-        return individual_weights
+        return self._selected_weights()[1].tolist()
     
     def validatePage(self):
         """Validate page"""
-        weights = self.get_weights()
+        weights, individual_weights = (w.tolist() for w in self._selected_weights())
 
         # Check minimum count
         if len(weights) < 2:
@@ -434,7 +441,6 @@ class WeightSettingsPage(QWizardPage):
         # Save settings
         wizard = self.wizard()
         if wizard:
-            individual_weights = self.get_individual_weights()
             wizard.settings = CalibrationSettings(
                 reference_weights=weights,
                 individual_weights=individual_weights,
@@ -453,6 +459,10 @@ class CollectionPage(QWizardPage):
     
     collection_completed = pyqtSignal()
     
+    # Number formatters for label updates (avoid re-parsing a format spec per call)
+    _FMT2 = "%.2f".__mod__
+    _FMT4 = "%.4f".__mod__
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setTitle("Data Collection")
@@ -463,6 +473,9 @@ class CollectionPage(QWizardPage):
         self.total_steps = 0
         self.is_collecting = False
         
+        # Last displayed sensor value (the engine already coalesces emissions)
+        self._latest_value = None
+        
         self._init_ui()
     
     def _init_ui(self):
@@ -566,6 +579,7 @@ class CollectionPage(QWizardPage):
 
                 # Connect signals
                 engine.data_point_added.connect(self.update_sensor_value)
+                engine.data_batch_added.connect(self.update_sensor_batch)
                 engine.progress_updated.connect(self.update_progress)
                 engine.point_collected.connect(self.on_point_collected)
                 engine.error_occurred.connect(self.on_error)
@@ -646,7 +660,15 @@ class CollectionPage(QWizardPage):
     @pyqtSlot(float)
     def update_sensor_value(self, value):
         """Update sensor value"""
-        self.current_value_label.setText(f"{value:.2f}")
+        if value != self._latest_value:
+            self._latest_value = value
+            self.current_value_label.setText(self._FMT2(value))
+
+    @pyqtSlot(object)
+    def update_sensor_batch(self, values):
+        """Update sensor value from collected batch (latest reading only)"""
+        if len(values):
+            self.update_sensor_value(float(values[-1]))
     
     @pyqtSlot(int, str)
     def update_progress(self, progress, status):
@@ -658,9 +680,9 @@ class CollectionPage(QWizardPage):
     def on_point_collected(self, point):
         """Point collection completed"""
         # Display statistics
-        self.average_label.setText(f"{point.average_reading:.2f}")
-        self.std_label.setText(f"{point.std_reading:.4f}")
-        self.sample_count_label.setText(f"{len(point.sensor_readings)}")
+        self.average_label.setText(self._FMT2(point.average_reading))
+        self.std_label.setText(self._FMT4(point.std_reading))
+        self.sample_count_label.setText(str(len(point.sensor_readings)))
         
         # Quality evaluation
         quality_score = point.quality_score
@@ -986,7 +1008,7 @@ class CalibrationWizard(QWizard):
         
         # Serial connection
         if self.serial_manager:
-            self.serial_manager.data_received.connect(self._on_serial_data)
+            self.serial_manager.data_batch.connect(self._on_serial_batch)
         
         # Completion signal
         self.finished.connect(self._on_finished)
@@ -999,16 +1021,20 @@ class CalibrationWizard(QWizard):
             self.data_processor.set_calibration_mode(True)
             self.logger.info("Data processor calibration mode activated")
     
-    @pyqtSlot(str)
-    def _on_serial_data(self, data):
-        """Serial data received"""
-        if self.calibration_engine.state == CalibrationState.COLLECTING:
+    @pyqtSlot(list)
+    def _on_serial_batch(self, batch):
+        """Serial data batch received"""
+        if self.calibration_engine.state != CalibrationState.COLLECTING:
+            return
+
+        add_reading = self.calibration_engine.add_sensor_reading
+        for data in batch:
             try:
                 # Parse data (needs adjustment for format)
-                value = float(data.strip())
-                self.calibration_engine.add_sensor_reading(value)
+                value = float(data)
             except ValueError:
-                pass  # Ignore invalid data
+                continue  # Ignore invalid data
+            add_reading(value)
     
     @pyqtSlot()
     def _on_collection_completed(self):
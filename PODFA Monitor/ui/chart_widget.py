@@ -8,6 +8,8 @@ Real-time chart display widget based on matplotlib
 import io
 import time
 import logging
+import tempfile
+from bisect import bisect_left, bisect_right
 from collections import deque
 from typing import List, Optional
 from dataclasses import dataclass
@@ -26,10 +28,9 @@ matplotlib.use('Qt5Agg')
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-from matplotlib import animation
 import numpy as np
 
-from core.data_processor import DataPoint
+from core.data_processor import DataPoint, DataPointView, CircularBuffer
 
 
 class DynamicYAxisManager:
@@ -47,22 +48,25 @@ class DynamicYAxisManager:
         self.min_y_max = 3.5        # 최소 Y축 최대값
         self.y_min = -0.5           # Y축 최소값 (고정)
     
-    def get_y_range(self, window_data: list, current_y_max: float = None) -> tuple:
+    def get_y_range(self, window_arr: Optional[np.ndarray], current_y_max: float = None,
+                    window_max: Optional[float] = None) -> tuple:
         """
         데이터 윈도우에 기반한 동적 Y축 범위 계산
         
         Args:
-            window_data: 현재 표시되는 데이터 값들
+            window_arr: 현재 표시되는 데이터 값 배열 (None 또는 빈 배열이면 기본 범위)
             current_y_max: 현재 Y축 최대값 (부드러운 전환용, 선택사항)
+            window_max: 미리 알고 있는 윈도우 최대값 (있으면 배열 탐색 생략)
             
         Returns:
             tuple: (y_min, y_max) Y축 범위
         """
-        if not self.enable_dynamic_scaling or not window_data:
+        if not self.enable_dynamic_scaling or window_arr is None or not window_arr.size:
             return (self.y_min, self.min_y_max)
         
-        # 데이터 최대값 기반 동적 계산
-        window_max = max(window_data)
+        # 데이터 최대값 기반 동적 계산 (NumPy 벡터 연산)
+        if window_max is None:
+            window_max = float(window_arr.max())
         target_y_max = window_max + self.margin
         
         # 최소 범위 보장
@@ -120,6 +124,13 @@ class ChartWidget(QWidget):
     # Signals
     data_exported = pyqtSignal(str)  # Data export completed
     
+    # Full history file layout (float64 rows)
+    HISTORY_CHUNK = 65536  # Rows added each time the history file grows
+    _COL_TIME = 0          # Arrival time (display)
+    _COL_VALUE = 1         # Display value
+    _COL_FIELDS = 2        # DataPoint fields (CircularBuffer.FIELDS order, None -> NaN)
+    _HISTORY_COLUMNS = _COL_FIELDS + len(CircularBuffer.FIELDS)
+    
     def __init__(self, name: str = "Chart", config: Optional[ChartConfig] = None, parent=None):
         super().__init__(parent)
         
@@ -127,17 +138,27 @@ class ChartWidget(QWidget):
         self.name = name
         self.config = config or ChartConfig()
         
-        # Data management
-        self.data_points: List[DataPoint] = []
-        self.time_buffer = deque(maxlen=10000)  # Time buffer (current view)
-        self.value_buffer = deque(maxlen=10000)  # Value buffer (current view)
+        # Full session history (disk-backed memmap, for scroll functionality and export)
+        # 첫 샘플 수신 시 임시 파일을 만들고 HISTORY_CHUNK 행 단위로 확장
+        self._history_file = None
+        self._history: Optional[np.memmap] = None
+        self._head = 0  # 누적 샘플 수 (다음 기록 행)
+        
+        # Current view: absolute sample index range [_view_start, _view_stop)
+        self._view_start = 0
+        self._view_stop = 0
         
-        # Full history (for scroll functionality)
-        self.full_time_history = deque(maxlen=50000)  # Full time history
-        self.full_value_history = deque(maxlen=50000)  # Full value history
+        # Sliding-window max: (absolute index, value) pairs with decreasing values
+        self._max_deque = deque()
+        
+        # Preallocated x coordinates for the view (view length <= max_points)
+        self._x_buf = np.empty(self.config.max_points, dtype=np.float64)
         
         self.max_sensor_value = float('-inf')
         
+        # Running value statistics (updated per sample, Welford mean/variance)
+        self._reset_value_statistics()
+        
         # Scroll state
         self.is_scrolling = False  # Whether user is scrolling
         self.scroll_position = 1.0  # 0.0(oldest data) ~ 1.0(latest data)
@@ -269,10 +290,12 @@ class ChartWidget(QWidget):
         
         # 빈 선 그래프 생성
         label = 'Equivalent Gram (g)' if self.is_calibrated else 'Voltage (mV)'
+        # (animated: 전체 그리기에서 제외하고 블리팅으로만 그림)
         self.line, = self.ax.plot([], [], 
                                   color=self.config.line_color, 
                                   linewidth=self.config.line_width,
-                                  label=label)
+                                  label=label,
+                                  animated=True)
         
         # Axis settings
         self.ax.set_xlabel('Time (sec)')
@@ -287,7 +310,7 @@ class ChartWidget(QWidget):
         # 캘리브레이션 상태에 따른 y축 범위 설정
         if self.is_calibrated:
             # 그램 단위일 때: 동적 스케일링 사용
-            y_range = self.y_axis_manager.get_y_range([])  # 빈 데이터로 기본 범위
+            y_range = self.y_axis_manager.get_y_range(None)  # 빈 데이터로 기본 범위
             self.ax.set_ylim(y_range[0], y_range[1])
             self.current_y_max = y_range[1]
             # Y축 틱을 자동으로 설정하도록 함
@@ -312,35 +335,62 @@ class ChartWidget(QWidget):
         # tight layout
         self.figure.tight_layout()
         
-        # 애니메이션 시작 (처음에는 정지 상태)
-        self.anim = animation.FuncAnimation(
-            self.figure, 
-            self._update_animation, 
-            interval=self.config.update_interval,
-            blit=False,  # Y축 라벨 동적 업데이트를 위해 blit 비활성화
-            cache_frame_data=False
-        )
-        self.anim.pause()  # 처음에는 정지
+        # 블리팅용 배경 (축/격자/범례) - 전체 그리기가 끝날 때마다 다시 저장
+        self._background = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        
+        # 갱신 타이머 (처음에는 정지, 샘플 수신과 무관하게 고정 주기로 그림)
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(self.config.update_interval)
+        self._refresh_timer.timeout.connect(self._refresh_chart)
+    
+    def _on_draw(self, event):
+        """전체 그리기 후 배경 저장 및 데이터 라인 그리기"""
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        if self.line.get_animated():
+            self.ax.draw_artist(self.line)
+    
+    def _refresh_chart(self):
+        """차트 갱신 (축 범위가 바뀔 때만 전체 그리기, 그 외에는 라인만 블리팅)"""
+        limits = (self.ax.get_xlim(), self.ax.get_ylim())
+        self._update_animation(None)
+        
+        if self._background is None or limits != (self.ax.get_xlim(), self.ax.get_ylim()):
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self._background)
+            self.ax.draw_artist(self.line)
+            self.canvas.blit(self.ax.bbox)
     
     def add_data_point(self, data_point: DataPoint):
         """Add data point"""
         current_time = time.time()
         
-        # 데이터 추가
-        self.data_points.append(data_point)
-        
         # 값 추출
         # 캘리브레이션된 값이 있으면 우선 사용 (0이나 음수도 유효함)
-        if data_point.calibrated_value is not None:
-            value = data_point.calibrated_value
-        elif data_point.filtered_value is not None:
-            value = data_point.filtered_value
+        calibrated_value = data_point.calibrated_value
+        filtered_value = data_point.filtered_value
+        if calibrated_value is not None:
+            value = calibrated_value
+        elif filtered_value is not None:
+            value = filtered_value
         else:
             value = data_point.raw_value
         
-        # 전체 히스토리에 추가 (삭제하지 않음)
-        self.full_time_history.append(current_time)
-        self.full_value_history.append(value)
+        # 전체 히스토리에 추가 (삭제하지 않음, 파일이 가득 차면 확장)
+        if self._history is None or self._head == len(self._history):
+            self._reserve_history(self._head + 1)
+        self._history[self._head] = (
+            current_time,
+            value,
+            data_point.timestamp,
+            data_point.raw_value,
+            np.nan if filtered_value is None else filtered_value,
+            np.nan if calibrated_value is None else calibrated_value,
+            getattr(data_point, 'quality_score', 1.0)
+        )
+        self._push_window_max(self._head, float(value))
+        self._head += 1
         
         # 스크롤 중이 아니면 최신 데이터로 뷰 업데이트
         if not self.is_scrolling:
@@ -353,116 +403,112 @@ class ChartWidget(QWidget):
         # 최대값 추적
         if value > self.max_sensor_value:
             self.max_sensor_value = value
+        if value < self._min_value:
+            self._min_value = value
+        delta = value - self._mean_value
+        self._mean_value += delta / self._head
+        self._m2_value += delta * (value - self._mean_value)
+        self._last_value = value
         
         # 첫 번째 데이터일 때 자동 시작
-        if len(self.data_points) == 1 and not self.is_updating:
+        if self._head == 1 and not self.is_updating:
             self.start_updates()
         
         self._update_statistics()
     
+    def _push_window_max(self, index: int, value: float):
+        """단조 덱에 샘플 추가 (자신보다 작거나 같은 뒤쪽 후보 제거)"""
+        dq = self._max_deque
+        while dq and dq[-1][1] <= value:
+            dq.pop()
+        dq.append((index, value))
+        
+        # 최신 뷰는 최대 max_points개이므로 그보다 오래된 후보는 모드와 무관하게 제거
+        oldest = index - self.config.max_points
+        while dq[0][0] <= oldest:
+            dq.popleft()
+    
+    def _live_window_max(self) -> Optional[float]:
+        """
+        최신 뷰 구간의 최대값 (O(1) 분할상환)
+        
+        뷰가 최신 샘플에서 끝날 때만 시작 인덱스가 단조 증가하므로 덱을 사용하고,
+        스크롤로 과거 구간을 볼 때는 None을 반환합니다.
+        """
+        if self._view_stop != self._head:
+            return None
+        dq = self._max_deque
+        while dq and dq[0][0] < self._view_start:
+            dq.popleft()
+        return dq[0][1] if dq else None
+    
     def _update_animation(self, frame):
-        """Animation update (FuncAnimation callback)"""
-        if not self.time_buffer:
+        """Animation update (line data and axis limits for one frame)"""
+        times, values = self._view_arrays()
+        if not times.size:
             return self.line,
         
         # 스크롤 중일 때와 실시간일 때 다르게 처리
         if self.is_scrolling:
-            # 스크롤 중 - 버퍼의 데이터를 그대로 표시
-            if self.time_buffer:
-                # 버퍼의 시간을 상대 시간으로 변환
-                times = list(self.time_buffer)
-                if times:
-                    start_time = times[0]
-                    relative_times = [(t - start_time) for t in times]
-                    
-                    self.line.set_data(relative_times, list(self.value_buffer))
-                    
-                    # Y축 범위 재계산
-                    if self.value_buffer:
-                        if self.is_calibrated:
-                            # 그램 단위: 진정한 동적 스케일링
-                            current_data = list(self.value_buffer)
-                            y_range = self.y_axis_manager.get_y_range(current_data, self.current_y_max)
-                            old_y_max = self.current_y_max
-                            self.ax.set_ylim(y_range[0], y_range[1])
-                            self.current_y_max = y_range[1]
-                            # Y축 틱을 자동으로 업데이트
-                            old_ticks = self.ax.get_yticks()
-                            self.ax.yaxis.set_major_locator(plt.MaxNLocator(nbins='auto'))
-                            new_ticks = self.ax.get_yticks()
-                            # Y축 범위가 변경된 경우에만 처리 (향후 로그 등 추가 가능)
-                            if abs(y_range[1] - old_y_max) > 0.1:
-                                pass  # 필요시 추가 처리
-                        else:
-                            # 전압 단위: 기존 자동 스케일
-                            y_min = min(self.value_buffer) * 0.95
-                            y_max = max(self.value_buffer) * 1.05
-                            if y_max - y_min < 10:
-                                y_center = (y_max + y_min) / 2
-                                y_min = y_center - 5
-                                y_max = y_center + 5
-                            self.ax.set_ylim(y_min, y_max)
-                            # Y축 틱을 자동으로 업데이트
-                            old_ticks = self.ax.get_yticks()
-                            self.ax.yaxis.set_major_locator(plt.MaxNLocator(nbins='auto'))
-                            new_ticks = self.ax.get_yticks()
+            # 스크롤 중 - 버퍼의 시간을 상대 시간으로 변환
+            self.line.set_data(self._x_axis(times, times[0]), values)
+            
+            # Y축 범위 재계산
+            if self.is_calibrated:
+                # 그램 단위: 진정한 동적 스케일링
+                y_range = self.y_axis_manager.get_y_range(values, self.current_y_max)
+                self.ax.set_ylim(y_range[0], y_range[1])
+                self.current_y_max = y_range[1]
+            else:
+                # 전압 단위: 기존 자동 스케일
+                self.ax.set_ylim(*self._voltage_y_range(values))
         else:
             # 실시간 모드 - 현재 시간 기준 상대 시간 (오른쪽이 최신)
             current_time = time.time()
-            relative_times = [current_time - t for t in self.time_buffer]
-            relative_times = [self.config.time_window - rt for rt in relative_times]  # 뒤집기
-            
-            self.line.set_data(relative_times, list(self.value_buffer))
+            self.line.set_data(self._x_axis(times, current_time - self.config.time_window), values)
         
         # X축 범위 (항상 윈도우 크기 고정)
         self.ax.set_xlim(0, self.config.time_window)
         
         # Y축 범위 설정 (캘리브레이션 상태에 따라)
-        if self.is_calibrated and self.value_buffer:
+        if self.is_calibrated:
             # 그램 단위: 진정한 동적 스케일링
-            current_data = list(self.value_buffer)
-            y_range = self.y_axis_manager.get_y_range(current_data, self.current_y_max)
-            old_y_max = self.current_y_max
+            y_range = self.y_axis_manager.get_y_range(
+                values, self.current_y_max, window_max=self._live_window_max())
             self.ax.set_ylim(y_range[0], y_range[1])
             self.current_y_max = y_range[1]
-            # Y축 틱을 자동으로 업데이트
-            old_ticks = self.ax.get_yticks()
-            self.ax.yaxis.set_major_locator(plt.MaxNLocator(nbins='auto'))
-            new_ticks = self.ax.get_yticks()
-            # Y축 범위가 변경된 경우에만 처리 (향후 로그 등 추가 가능)
-            if abs(y_range[1] - old_y_max) > 0.1:
-                pass  # 필요시 추가 처리
-        elif not self.is_calibrated and self.value_buffer:
+        else:
             # 전압 단위: 기존 자동 스케일
-            y_min = min(self.value_buffer) * 0.95
-            y_max = max(self.value_buffer) * 1.05
-            if y_max - y_min < 10:  # 최소 범위 보장
-                y_center = (y_max + y_min) / 2
-                y_min = y_center - 5
-                y_max = y_center + 5
-            self.ax.set_ylim(y_min, y_max)
-            # Y축 틱을 자동으로 업데이트
-            old_ticks = self.ax.get_yticks()
-            self.ax.yaxis.set_major_locator(plt.MaxNLocator(nbins='auto'))
-            new_ticks = self.ax.get_yticks()
+            self.ax.set_ylim(*self._voltage_y_range(values))
         
         return self.line,
     
+    def _x_axis(self, times: np.ndarray, origin: float) -> np.ndarray:
+        """뷰 시간 배열을 origin 기준 상대 시간으로 변환 (미리 할당한 버퍼에 기록)"""
+        x = self._x_buf[:len(times)]
+        np.subtract(times, origin, out=x)
+        return x
+    
+    @staticmethod
+    def _voltage_y_range(values: np.ndarray) -> tuple:
+        """전압 모드 Y축 범위 (±5% 여유, 최소 범위 10 보장)"""
+        y_min = float(values.min()) * 0.95
+        y_max = float(values.max()) * 1.05
+        if y_max - y_min < 10:  # 최소 범위 보장
+            y_center = (y_max + y_min) / 2
+            y_min = y_center - 5
+            y_max = y_center + 5
+        return y_min, y_max
+    
     def start_updates(self):
         """Start updates and animation"""
         self.is_updating = True
         self.is_measuring = True  # 측정 시작
         
-        # 애니메이션 시작/재시작
-        if hasattr(self, 'anim') and self.anim is not None:
-            try:
-                if hasattr(self.anim, 'event_source') and not self.anim.event_source:
-                    # 이벤트 소스가 중지된 경우 재시작
-                    self.anim.event_source.start()
-                else:
-                    self.anim.resume()
-            except Exception as e:
-                self.logger.debug(f"Animation start error (ignored): {e}")
+        # 갱신 타이머 시작 (측정 중에는 라인 안티에일리어싱 해제)
+        if hasattr(self, '_refresh_timer'):
+            self._set_live_rendering(True)
+            self._refresh_timer.start()
         
         if hasattr(self, 'play_action'):
             self.play_action.setChecked(True)
@@ -471,18 +517,21 @@ class ChartWidget(QWidget):
         
         self.logger.info(f"Chart '{self.name}' updates started")
     
+    def _set_live_rendering(self, live: bool):
+        """실시간 측정 중에는 라인 안티에일리어싱을 꺼서 래스터화 비용 절감"""
+        if self.line.get_antialiased() == live:
+            self.line.set_antialiased(not live)
+            self.canvas.draw_idle()
+    
     def stop_updates(self):
         """Stop updates and animation completely"""
         self.is_updating = False
         self.is_measuring = False  # 측정 중단
         
-        # 애니메이션 완전 중지
-        if hasattr(self, 'anim') and self.anim is not None:
-            try:
-                self.anim.pause()  # 먼저 일시 정지
-                self.anim.event_source.stop()  # 이벤트 소스 중지
-            except Exception as e:
-                self.logger.debug(f"Animation stop error (ignored): {e}")
+        # 갱신 타이머 중지 (정지 화면은 안티에일리어싱으로 다시 그림)
+        if hasattr(self, '_refresh_timer'):
+            self._refresh_timer.stop()
+            self._set_live_rendering(False)
         
         if hasattr(self, 'play_action'):
             self.play_action.setChecked(False)
@@ -494,7 +543,7 @@ class ChartWidget(QWidget):
     def _confirm_clear_data(self):
         """Confirm before clearing data"""
         # 데이터가 있는 경우에만 확인
-        if self.data_points and len(self.data_points) > 0:
+        if self._head > 0:
             from PyQt6.QtWidgets import QMessageBox
             
             reply = QMessageBox.question(
@@ -502,7 +551,7 @@ class ChartWidget(QWidget):
                 "Clear Data Confirmation",
                 f"Are you sure you want to clear all data?\n\n"
                 f"Chart: {self.name}\n"
-                f"Data points: {len(self.data_points)} points\n\n"
+                f"Data points: {self._head} points\n\n"
                 "This action cannot be undone.",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
                 QMessageBox.StandardButton.No
@@ -516,15 +565,15 @@ class ChartWidget(QWidget):
     
     def clear_data(self):
         """Clear data"""
-        self.data_points.clear()
-        self.time_buffer.clear()
-        self.value_buffer.clear()
-        
-        # 히스토리도 초기화
-        self.full_time_history.clear()
-        self.full_value_history.clear()
+        # 히스토리 파일 해제 및 뷰 구간 초기화 (다음 측정은 새 파일 사용)
+        self._release_history()
+        self._head = 0
+        self._view_start = 0
+        self._view_stop = 0
+        self._max_deque.clear()
         
         self.max_sensor_value = float('-inf')
+        self._reset_value_statistics()
         self.scroll_position = 1.0
         self.is_scrolling = False
         
@@ -534,7 +583,7 @@ class ChartWidget(QWidget):
         # Y축 범위 초기화 (캘리브레이션 상태에 따라)
         if self.is_calibrated:
             # 그램 단위: 기본 범위로 초기화
-            y_range = self.y_axis_manager.get_y_range([])  # 빈 데이터로 기본 범위
+            y_range = self.y_axis_manager.get_y_range(None)  # 빈 데이터로 기본 범위
             self.ax.set_ylim(y_range[0], y_range[1])
             self.current_y_max = y_range[1]
             # Y축 틱을 자동으로 설정
@@ -591,7 +640,7 @@ class ChartWidget(QWidget):
         self._update_view_buffers()
         
         # 스크롤 시 즉시 차트 업데이트
-        if self.time_buffer:
+        if self._view_stop > self._view_start:
             self._update_chart_immediately()
     
     def _go_to_latest(self):
@@ -605,41 +654,28 @@ class ChartWidget(QWidget):
     
     def _update_chart_immediately(self):
         """Update chart immediately during scroll"""
-        if not self.time_buffer:
+        times, values = self._view_arrays()
+        if not times.size:
             return
         
         try:
-            # 시간을 상대 시간으로 변환
-            times = list(self.time_buffer)
-            start_time = times[0]
-            relative_times = [(t - start_time) for t in times]
-            
-            # 라인 데이터 설정
-            self.line.set_data(relative_times, list(self.value_buffer))
+            # 시간을 상대 시간으로 변환하여 라인 데이터 설정
+            self.line.set_data(self._x_axis(times, times[0]), values)
             
             # Y축 범위 재계산 - 캘리브레이션 상태에 따라 분기
-            if self.value_buffer:
-                if self.is_calibrated:
-                    # 그램 모드: 동적 스케일링 사용
-                    current_data = list(self.value_buffer)
-                    y_range = self.y_axis_manager.get_y_range(current_data, self.current_y_max)
-                    self.ax.set_ylim(y_range[0], y_range[1])
-                    self.current_y_max = y_range[1]
-                    # Y축 틱을 자동으로 업데이트
-                    self.ax.yaxis.set_major_locator(plt.MaxNLocator(nbins='auto'))
-                else:
-                    # 전압 모드: 기존 로직 유지
-                    y_min = min(self.value_buffer) * 0.95
-                    y_max = max(self.value_buffer) * 1.05
-                    if y_max - y_min < 10:
-                        y_center = (y_max + y_min) / 2
-                        y_min = y_center - 5
-                        y_max = y_center + 5
-                    self.ax.set_ylim(y_min, y_max)
+            if self.is_calibrated:
+                # 그램 모드: 동적 스케일링 사용
+                y_range = self.y_axis_manager.get_y_range(values, self.current_y_max)
+                self.ax.set_ylim(y_range[0], y_range[1])
+                self.current_y_max = y_range[1]
+                # Y축 틱을 자동으로 업데이트
+                self.ax.yaxis.set_major_locator(plt.MaxNLocator(nbins='auto'))
+            else:
+                # 전압 모드: 기존 로직 유지
+                self.ax.set_ylim(*self._voltage_y_range(values))
             
             # X축 범위 설정
-            if relative_times:
-                self.ax.set_xlim(0, self.config.time_window)
+            self.ax.set_xlim(0, self.config.time_window)
             
             # 캔버스 다시 그리기
             self.canvas.draw()
@@ -649,39 +685,72 @@ class ChartWidget(QWidget):
     
     def _update_statistics(self):
         """Update statistics"""
-        count = len(self.data_points)
+        count = self._head
         max_val = self.max_sensor_value if self.max_sensor_value != float('-inf') else 0
         
         text = f"Data: {count} points | Max: {max_val:.3f}g"
         if hasattr(self, 'stats_label'):
             self.stats_label.setText(text)
     
-    def get_visible_data(self) -> List[DataPoint]:
+    @property
+    def data_count(self) -> int:
+        """누적 데이터 포인트 수"""
+        return self._head
+    
+    def _reset_value_statistics(self):
+        """누적 값 통계 초기화"""
+        self._min_value = float('inf')
+        self._mean_value = 0.0
+        self._m2_value = 0.0  # 평균 편차 제곱합
+        self._last_value = 0.0
+    
+    def get_value_statistics(self) -> dict:
+        """누적 값 통계 반환 (샘플마다 갱신한 값, 히스토리를 다시 훑지 않음)"""
+        count = self._head
+        return {
+            'data_count': count,
+            'min_value': self._min_value,
+            'max_value': self.max_sensor_value,
+            'avg_value': self._mean_value,
+            'std_value': (self._m2_value / (count - 1)) ** 0.5 if count > 1 else 0.0,
+            'last_value': self._last_value,
+        }
+    
+    @property
+    def data_points(self) -> List[DataPointView]:
+        """전체 데이터 포인트 (내보내기용, 접근할 때마다 히스토리에서 재구성)"""
+        return self._points_from_fields(self._history_fields())
+    
+    def _history_fields(self) -> np.ndarray:
+        """히스토리의 DataPoint 필드 행렬 (행 = 샘플)"""
+        if self._history is None:
+            return np.empty((0, len(CircularBuffer.FIELDS)))
+        return self._history[:self._head, self._COL_FIELDS:]
+    
+    @staticmethod
+    def _points_from_fields(fields: np.ndarray) -> List[DataPointView]:
+        """필드 행렬을 DataPointView 목록으로 변환 (히스토리 파일과 분리된 사본 사용)"""
+        columns = np.ascontiguousarray(fields.T)
+        return CircularBuffer.to_views(dict(zip(CircularBuffer.FIELDS, columns)))
+    
+    def get_visible_data(self) -> List[DataPointView]:
         """Return visible DataPoint objects for export"""
-        if not self.data_points:
-            return []
+        fields = self._history_fields()
         
         # 측정 중일 때만 시간 윈도우 적용, 측정 완료 후에는 모든 데이터 반환
-        if self.is_measuring:
+        if self.is_measuring and len(fields):
             # 실시간 측정 중: 현재 보이는 시간 범위의 데이터만 반환
-            current_time = time.time()
-            visible_data = []
-            
-            for dp in self.data_points:
-                time_diff = current_time - dp.timestamp
-                if time_diff <= self.config.time_window:
-                    visible_data.append(dp)
-            
-            return visible_data
-        else:
-            # 측정 완료: 모든 데이터 반환 (시간에 관계없이)
-            return list(self.data_points)
+            # (타임스탬프는 증가 순이므로 시작 위치만 이진 탐색해 뒷부분만 변환)
+            start = bisect_left(fields[:, 0], time.time() - self.config.time_window)
+            fields = fields[start:]
+        
+        return self._points_from_fields(fields)
     
     def cleanup(self):
         """Clean up resources"""
-        # 애니메이션 정지
-        if hasattr(self, 'anim'):
-            self.anim.event_source.stop()
+        # 갱신 타이머 정지
+        if hasattr(self, '_refresh_timer'):
+            self._refresh_timer.stop()
         
         # 데이터 초기화
         self.clear_data()
@@ -759,7 +828,10 @@ class ChartWidget(QWidget):
             # 그리드를 모든 틱 위치에 표시 (10 간격으로 모든 라벨에 그리드 선)
             self.ax.grid(True, axis='both', alpha=0.4, linewidth=1.0)
             
-            # 이미지 생성
+            # 이미지 생성 (블리팅용 animated 라인도 함께 그리도록 해제)
+            self.line.set_animated(False)
+            live_antialiased = self.line.get_antialiased()
+            self.line.set_antialiased(True)
             buffer = io.BytesIO()
             self.figure.savefig(
                 buffer, 
@@ -774,6 +846,8 @@ class ChartWidget(QWidget):
             buffer.seek(0)
             
             # matplotlib 설정 복원
+            self.line.set_animated(True)
+            self.line.set_antialiased(live_antialiased)
             matplotlib.rcParams.update(original_rcParams)
             
             # 원래 크기, DPI, 축 설정 복원
@@ -793,50 +867,75 @@ class ChartWidget(QWidget):
             self.logger.error(f"Failed to generate chart image: {e}")
             return None
 
+    def _reserve_history(self, rows: int):
+        """히스토리 파일을 rows 행 이상으로 확장 (처음 호출 시 임시 파일 생성)"""
+        if self._history_file is None:
+            self._history_file = tempfile.TemporaryFile(prefix='pbs_chart_')
+        
+        capacity = -(-rows // self.HISTORY_CHUNK) * self.HISTORY_CHUNK
+        self._history = None  # 기존 매핑을 해제한 뒤 더 큰 크기로 다시 매핑
+        self._history = np.memmap(
+            self._history_file, dtype=np.float64, mode='r+',
+            shape=(capacity, self._HISTORY_COLUMNS)
+        )
+    
+    def _release_history(self):
+        """히스토리 매핑 해제 및 임시 파일 삭제"""
+        self._history = None
+        if self._history_file is not None:
+            self._history_file.close()
+            self._history_file = None
+    
+    def _view_arrays(self) -> tuple:
+        """현재 뷰 구간의 (시간, 값) 배열 반환 (히스토리 파일의 복사 없는 뷰)"""
+        if self._view_stop <= self._view_start:
+            return np.empty(0), np.empty(0)
+        rows = np.asarray(self._history[self._view_start:self._view_stop])
+        return rows[:, self._COL_TIME], rows[:, self._COL_VALUE]
+    
+    def _search_time(self, t: float, side: str) -> int:
+        """히스토리에서 시간 t의 삽입 위치 반환 (열 사본 없이 이진 탐색)"""
+        times = self._history[:self._head, self._COL_TIME]
+        search = bisect_right if side == 'right' else bisect_left
+        return search(times, t)
+    
     def _update_view_buffers(self):
         """Update view buffers based on current scroll position"""
-        if not self.full_time_history:
+        if not self._head:
             return
         
-        # 전체 데이터를 리스트로 변환
-        full_times = list(self.full_time_history)
-        full_values = list(self.full_value_history)
-        
-        if not full_times:
-            return
+        first_time = float(self._history[0, self._COL_TIME])
+        last_time = float(self._history[self._head - 1, self._COL_TIME])
         
         # 전체 시간 범위
-        total_duration = full_times[-1] - full_times[0] if len(full_times) > 1 else self.config.time_window
+        total_duration = last_time - first_time if self._head > 1 else self.config.time_window
         
         # 스크롤 위치에 따른 종료 시점 계산
         if self.scroll_position >= 1.0:
             # 최신 데이터
-            end_time = full_times[-1]
+            end_time = last_time
         else:
             # 스크롤 위치를 전체 데이터 범위에 매핑
             available_scroll_range = total_duration - self.config.time_window
             if available_scroll_range > 0:
                 # 스크롤 가능한 범위가 있는 경우
-                end_time = full_times[0] + self.config.time_window + (available_scroll_range * self.scroll_position)
+                end_time = first_time + self.config.time_window + (available_scroll_range * self.scroll_position)
             else:
                 # 전체 데이터가 윈도우보다 작은 경우
-                end_time = full_times[-1]
+                end_time = last_time
         
         # 윈도우 시작 시점
         start_time = end_time - self.config.time_window
         
-        # 해당 범위의 데이터 추출
-        self.time_buffer.clear()
-        self.value_buffer.clear()
-        
-        for t, v in zip(full_times, full_values):
-            if start_time <= t <= end_time:
-                self.time_buffer.append(t)
-                self.value_buffer.append(v)
+        # 해당 범위의 인덱스 구간 추출 (최대 max_points개)
+        stop = self._search_time(end_time, 'right')
+        start = self._search_time(start_time, 'left')
+        self._view_start = max(start, stop - self.config.max_points)
+        self._view_stop = stop
 
     def _update_scrollbar_range(self):
         """Update scrollbar range and page size"""
-        if not self.full_time_history or len(self.full_time_history) < 2:
+        if self._head < 2:
             # 데이터가 부족할 때는 전체 크기로 설정
             self.scrollbar.setEnabled(False)
             self.scrollbar.setPageStep(100)  # 전체 크기
@@ -844,8 +943,8 @@ class ChartWidget(QWidget):
             return
         
         # 전체 데이터 기간 계산
-        full_times = list(self.full_time_history)
-        total_duration = full_times[-1] - full_times[0]
+        total_duration = float(self._history[self._head - 1, self._COL_TIME]
+                               - self._history[0, self._COL_TIME])
         
         if total_duration <= self.config.time_window:
             # 윈도우보다 작거나 같으면 스크롤 불필요
@@ -903,7 +1002,7 @@ class ChartWidget(QWidget):
         # Y축 범위 업데이트 (상태 변경 여부와 관계없이 항상 실행)
         if is_calibrated:
             # 그램 단위: 동적 스케일링 사용
-            current_data = list(self.value_buffer) if self.value_buffer else []
+            current_data = self._view_arrays()[1]
             y_range = self.y_axis_manager.get_y_range(current_data)
             self.ax.set_ylim(y_range[0], y_range[1])
             self.current_y_max = y_range[1]
@@ -937,7 +1036,7 @@ class ChartWidget(QWidget):
         
         if self.is_calibrated:
             # 현재 데이터에 맞는 Y축 범위 적용
-            current_data = list(self.value_buffer) if self.value_buffer else []
+            current_data = self._view_arrays()[1]
             y_range = self.y_axis_manager.get_y_range(current_data)
             self.ax.set_ylim(y_range[0], y_range[1])
             self.current_y_max = y_range[1]
@@ -962,8 +1061,8 @@ class ChartWidget(QWidget):
         self.y_axis_manager.set_margin(margin)
         
         # 현재 데이터에 새 여유분 적용
-        if self.is_calibrated and self.value_buffer:
-            current_data = list(self.value_buffer)
+        if self.is_calibrated and self._view_stop > self._view_start:
+            current_data = self._view_arrays()[1]
             y_range = self.y_axis_manager.get_y_range(current_data, self.current_y_max)
             self.ax.set_ylim(y_range[0], y_range[1])
             self.current_y_max = y_range[1]
@@ -27,7 +27,7 @@ from PyQt6.QtGui import QFont, QAction
 import qtawesome as qta
 
 from core.serial_manager import SerialManager, SerialConfig, ConnectionState
-from core.data_processor import DataProcessor, DataPoint
+from core.data_processor import DataProcessor, DataPoint, CircularBuffer
 from core.calibration import CalibrationEngine
 from utils.excel_exporter import ExcelExporter, ExportOptions
 from ui.chart_widget import ChartWidget
@@ -158,11 +158,11 @@ class WorkbenchWidget(QWidget):
     
     def _update_chart_statistics(self, chart_widget: ChartWidget):
         """차트 통계 업데이트"""
-        if hasattr(chart_widget, 'data_points'):
-            # ChartWidget의 데이터 포인트를 통계 테이블에 업데이트
+        if hasattr(chart_widget, 'get_value_statistics'):
+            # ChartWidget의 누적 통계를 통계 테이블에 업데이트
             self.statistics_table.update_chart_statistics(
                 chart_widget.name, 
-                list(chart_widget.data_points)
+                chart_widget.get_value_statistics()
             )
     
     def update_all_statistics(self):
@@ -391,7 +391,7 @@ class MainWindow(QMainWindow):
     def _connect_signals(self):
         """시그널 연결"""
         # 시리얼 매니저 시그널
-        self.serial_manager.data_received.connect(self._on_serial_data)
+        self.serial_manager.data_batch.connect(self._on_serial_batch)
         self.serial_manager.connection_changed.connect(self._on_connection_changed)
         self.serial_manager.port_list_updated.connect(self._on_ports_updated)
         self.serial_manager.error_occurred.connect(self._on_serial_error)
@@ -851,12 +851,12 @@ class MainWindow(QMainWindow):
                 return
             
             # 기존 데이터가 있는지 확인
-            if current_chart.data_points and len(current_chart.data_points) > 0:
+            if current_chart.data_count > 0:
                 reply = QMessageBox.question(
                     self,
                     "Data Reset Confirmation",
                     f"'{current_chart.name}' contains existing data.\n\n"
-                    f"Current data points: {len(current_chart.data_points)} points\n\n"
+                    f"Current data points: {current_chart.data_count} points\n\n"
                     "Starting a new measurement will reset all data and charts.\n"
                     "Do you want to continue?",
                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
@@ -1141,29 +1141,30 @@ class MainWindow(QMainWindow):
         
         # 데이터 통계
         chart = self._get_current_chart()
-        if chart and chart.data_points:
-            count = len(chart.data_points)
+        if chart and chart.data_count:
+            count = chart.data_count
             self.data_stats_label.setText(f"Data: {count:,} points")
         else:
             self.data_stats_label.setText("Data: 0 points")
     
     # 이벤트 핸들러
-    def _on_serial_data(self, data: str):
-        """시리얼 데이터 수신"""
-        # 데이터 처리
-        data_point = self.data_processor.process_raw_data(data)
-        
-        if data_point:
-            # 현재 차트에 데이터 추가
-            chart = self._get_current_chart()
-            
-            if chart:
+    def _on_serial_batch(self, batch: list):
+        """시리얼 데이터 일괄 수신"""
+        # 배치 전체를 한 번에 파싱 및 처리 (줄마다 float 변환하지 않음)
+        result = self.data_processor.process_raw_chunk('\n'.join(batch))
+        if result is None:
+            return
+        
+        # 현재 차트에 데이터 추가
+        chart = self._get_current_chart()
+        if chart:
+            for data_point in CircularBuffer.to_views(result):
                 chart.add_data_point(data_point)
-                
-                # 통계 업데이트
-                workbench = self._get_current_workbench()
-                if workbench:
-                    workbench._update_chart_statistics(chart)
+            
+            # 통계 업데이트 (배치당 1회)
+            workbench = self._get_current_workbench()
+            if workbench:
+                workbench._update_chart_statistics(chart)
     
     def _on_data_processed(self, data_point: DataPoint):
         """데이터 처리 완료"""
@@ -22,7 +22,6 @@ from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont, QColor, QBrush
 import qtawesome as qta
 
-from core.data_processor import DataPoint
 from ui.chart_widget import ChartWidget
 
 
@@ -509,33 +508,29 @@ class StatisticsTableWidget(QWidget):
                 self.table.removeRow(row)
                 break
     
-    def update_chart_statistics(self, chart_name: str, data_points: List[DataPoint]):
-        """차트 통계 업데이트"""
+    def update_chart_statistics(self, chart_name: str, values: Dict[str, float]):
+        """
+        차트 통계 업데이트
+        
+        Args:
+            chart_name: 차트 이름
+            values: 차트가 샘플마다 누적한 통계 (ChartWidget.get_value_statistics)
+        """
         if chart_name not in self.chart_statistics:
             return
             
         stats = self.chart_statistics[chart_name]
         
-        if not data_points:
+        if not values['data_count']:
             # 데이터가 없는 경우 초기화
             stats.reset()
         else:
-            # 통계 계산
-            values = [dp.value for dp in data_points]
-            
-            stats.data_count = len(values)
-            stats.min_value = min(values)
-            stats.max_value = max(values)
-            stats.avg_value = sum(values) / len(values)
-            
-            # 표준편차 계산
-            if len(values) > 1:
-                variance = sum((x - stats.avg_value) ** 2 for x in values) / (len(values) - 1)
-                stats.std_value = variance ** 0.5
-            else:
-                stats.std_value = 0.0
-            
-            stats.last_value = values[-1]
+            stats.data_count = values['data_count']
+            stats.min_value = values['min_value']
+            stats.max_value = values['max_value']
+            stats.avg_value = values['avg_value']
+            stats.std_value = values['std_value']
+            stats.last_value = values['last_value']
             stats.last_update_time = datetime.now()
     
     def _update_display(self):
@@ -220,6 +220,23 @@ class EnhancedExcelExporter:
         
         return len(data_points)
     
+    @staticmethod
+    def _to_columns(data_points: List[DataPoint]) -> tuple:
+        """DataPoint 목록을 필드별 float64 배열로 변환 (None은 NaN)"""
+        count = len(data_points)
+        nan = float('nan')
+        timestamps = np.fromiter((dp.timestamp for dp in data_points), dtype=np.float64, count=count)
+        raw = np.fromiter((dp.raw_value for dp in data_points), dtype=np.float64, count=count)
+        filtered = np.fromiter(
+            (nan if dp.filtered_value is None else dp.filtered_value for dp in data_points),
+            dtype=np.float64, count=count)
+        calibrated = np.fromiter(
+            (nan if dp.calibrated_value is None else dp.calibrated_value for dp in data_points),
+            dtype=np.float64, count=count)
+        quality = np.fromiter((getattr(dp, 'quality_score', 1.0) for dp in data_points),
+                              dtype=np.float64, count=count)
+        return timestamps, raw, filtered, calibrated, quality
+    
     def _create_combined_sheet(
         self,
         worksheet: Worksheet,
@@ -282,13 +299,18 @@ class EnhancedExcelExporter:
             data_title_cell.font = Font(size=14, bold=True, color="2F5597")
         current_row += 2
         
+        # 필드별 배열로 변환 (None은 NaN) - 행마다 None 검사를 반복하지 않음
+        timestamps, raw, filtered, calibrated, quality = self._to_columns(data_points)
+        has_filtered = not np.isnan(filtered).all()
+        has_calibrated = options.use_calibrated_values and not np.isnan(calibrated).all()
+        
         # 데이터 헤더 생성
         headers = ["Time", "Raw Value"]
         
-        if any(dp.filtered_value is not None for dp in data_points):
+        if has_filtered:
             headers.append("Filtered Value")
             
-        if options.use_calibrated_values and any(dp.calibrated_value is not None for dp in data_points):
+        if has_calibrated:
             headers.append("Weight (g)")
             
         if options.include_quality_scores:
@@ -304,36 +326,39 @@ class EnhancedExcelExporter:
         current_row += 1
         
         # 데이터 작성
-        for dp in data_points:
+        start_time = timestamps[0]
+        for timestamp, raw_value, filtered_value, calibrated_value, quality_score in zip(
+                timestamps.tolist(), raw.tolist(), filtered.tolist(),
+                calibrated.tolist(), quality.tolist()):
             col = 1
             
             # 시간 (상대적)
-            time_diff = dp.timestamp - data_points[0].timestamp if data_points else 0
+            time_diff = timestamp - start_time
             worksheet.cell(row=current_row, column=col, value=f"{time_diff:.1f}s")
             col += 1
             
             # 원시값
-            raw_val = round(dp.raw_value, options.decimal_places)
+            raw_val = round(raw_value, options.decimal_places)
             worksheet.cell(row=current_row, column=col, value=raw_val)
             col += 1
             
-            # 필터링된 값
-            if any(dp.filtered_value is not None for dp in data_points):
-                if dp.filtered_value is not None:
-                    filtered_val = round(dp.filtered_value, options.decimal_places)
+            # 필터링된 값 (NaN은 빈 셀)
+            if has_filtered:
+                if filtered_value == filtered_value:
+                    filtered_val = round(filtered_value, options.decimal_places)
                     worksheet.cell(row=current_row, column=col, value=filtered_val)
                 col += 1
             
-            # 캘리브레이션된 값
-            if options.use_calibrated_values and any(dp.calibrated_value is not None for dp in data_points):
-                if dp.calibrated_value is not None:
-                    cal_val = round(dp.calibrated_value, options.decimal_places)
+            # 캘리브레이션된 값 (NaN은 빈 셀)
+            if has_calibrated:
+                if calibrated_value == calibrated_value:
+                    cal_val = round(calibrated_value, options.decimal_places)
                     worksheet.cell(row=current_row, column=col, value=cal_val)
                 col += 1
             
             # 품질 점수
             if options.include_quality_scores:
-                worksheet.cell(row=current_row, column=col, value=getattr(dp, 'quality_score', 1.0))
+                worksheet.cell(row=current_row, column=col, value=quality_score)
                 col += 1
             
             current_row += 1
@@ -348,13 +373,9 @@ class EnhancedExcelExporter:
                 stats_title_cell.font = Font(size=14, bold=True, color="2F5597")
             stats_row += 2
             
-            # 통계 데이터 계산
-            values = [
-                dp.calibrated_value if dp.calibrated_value is not None 
-                else dp.filtered_value if dp.filtered_value is not None
-                else dp.raw_value
-                for dp in data_points
-            ]
+            # 통계 데이터 계산 (캘리브레이션 > 필터링 > 원시값 순서로 선택)
+            values = np.where(~np.isnan(calibrated), calibrated,
+                              np.where(~np.isnan(filtered), filtered, raw))
             
             # 통계 헤더
             stats_headers = ["Metric", "Value"]
@@ -365,13 +386,12 @@ class EnhancedExcelExporter:
             stats_row += 1
             
             # 통계 값 계산 및 표시
-            import numpy as np
             stats_data = [
                 ("Count", len(values)),
-                ("Max", f"{max(values):.3f}"),
-                ("Min", f"{min(values):.3f}"),
-                ("Mean", f"{np.mean(values):.3f}"),
-                ("Std Dev", f"{np.std(values):.3f}"),
+                ("Max", f"{values.max():.3f}"),
+                ("Min", f"{values.min():.3f}"),
+                ("Mean", f"{values.mean():.3f}"),
+                ("Std Dev", f"{values.std():.3f}"),
                 ("Median", f"{np.median(values):.3f}")
             ]
             